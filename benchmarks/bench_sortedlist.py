@@ -19,13 +19,43 @@ except Exception:  # pragma: no cover
 from sorted_containers import SortedList as MojoSortedList
 
 
-def bench(label: str, cls, n: int) -> None:
-    start = time.perf_counter()
+def build_add(cls, n: int) -> None:
     sl = cls()
     for i in range(n):
         sl.add(i)
-    duration = time.perf_counter() - start
-    print(f"{label:24s} n={n:8d}  {duration:8.4f}s")
+
+
+def build_update(cls, n: int) -> None:
+    sl = cls()
+    sl.update(range(n))
+
+
+def build_bulk(cls, n: int) -> None:
+    cls(range(n))
+
+
+VARIANTS = [
+    ("add", build_add),
+    ("update", build_update),
+    ("bulk init", build_bulk),
+]
+
+
+def bench(label: str, cls, n: int, runs: int = 5) -> None:
+    for variant, build in VARIANTS:
+        try:
+            build(cls, min(n, 1_000))  # warm-up
+        except Exception:  # the Mojo type raises plain Exception when unsupported
+            print(f"{label:24s} {variant:10s} n={n:8d}  unsupported (skipped)")
+            continue
+
+        total_ns = 0
+        for _ in range(runs):
+            start = time.perf_counter_ns()
+            build(cls, n)
+            total_ns += time.perf_counter_ns() - start
+        duration = total_ns / runs / 1e9
+        print(f"{label:24s} {variant:10s} n={n:8d}  {duration:8.4f}s")
 
 
 def main() -> None:
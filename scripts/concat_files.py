@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import os
+import shutil
 import sys
 from pathlib import Path
 
@@ -16,20 +17,24 @@ def main():
 
     output_file = dir_path / "all.txt"
 
-    with open(output_file, "w") as out:  # 'w' mode overwrites existing file
-        for path in sorted(dir_path.iterdir()):
+    # DirEntry caches the stat result, so the type checks cost no extra syscalls
+    with os.scandir(dir_path) as it:
+        entries = sorted(it, key=lambda e: e.name)
+
+    with open(output_file, "wb") as out:  # 'wb' mode overwrites existing file
+        for entry in entries:
             if (
-                path.is_file()
-                and not path.is_symlink()
-                and not path.suffix.lower() == ".off"
+                entry.is_file(follow_symlinks=False)
+                and not entry.name.lower().endswith(".off")
+                and entry.name != output_file.name  # never stream the output into itself
             ):
-                print(f"===== {path.name} =====", file=out)
+                out.write(f"===== {entry.name} =====\n".encode())
                 try:
-                    with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                        out.write(f.read())
+                    with open(entry.path, "rb") as f:
+                        shutil.copyfileobj(f, out, 1 << 20)  # 1 MiB chunks
                 except Exception:
                     pass  # Skip unreadable files silently
-                out.write("\n\n")
+                out.write(b"\n\n")
 
     print(f"Concatenated to {output_file}")
 
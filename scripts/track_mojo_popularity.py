@@ -2,7 +2,6 @@
 # dependencies = [
 #   "requests",
 #   "pytrends",
-#   "pandas",
 #   "plotly",
 # ]
 # requires-python = ">=3.9"
@@ -12,8 +11,8 @@ import requests
 import json
 import time
 import csv
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import os
@@ -30,14 +29,48 @@ SO_TAGS = ["mojolang", "mojo"]
 
 TRENDS_KEYWORD = "Mojo programming language"
 
+GITHUB_HEADERS = {"Accept": "application/vnd.github.v3+json"}
+
+# Retries (with exponential backoff) when an API signals rate limiting
+MAX_RETRIES = 3
+
 CSV_FILE = "mojo_popularity_tracking.csv"
 HTML_PLOT_FILE = "mojo_popularity_trends.html"
 
+# CSV column order; rows are written as plain tuples in this order
+FIELDS = (
+    "date",
+    "total_github_stars",
+    "so_questions",
+    "google_trends_score",
+    "details_github",
+    "details_so",
+)
+
+# ---------- Shared Clients ----------
+# Module-level so repeated runs in one process (loops, schedulers) reuse
+# pooled connections and the Google cookie handshake
+_SESSION = requests.Session()
+_PYTRENDS = None
+
+def get_pytrends():
+    global _PYTRENDS
+    if _PYTRENDS is None:
+        _PYTRENDS = TrendReq(hl='en-US', tz=360)
+    return _PYTRENDS
+
 # ---------- Helper Functions ----------
-def get_github_stats(owner_repo):
+def get_with_backoff(session, url, **kwargs):
+    """GET via the shared session, backing off only on 403/429 responses."""
+    for attempt in range(MAX_RETRIES + 1):
+        response = session.get(url, **kwargs)
+        if response.status_code not in (403, 429) or attempt == MAX_RETRIES:
+            return response
+        time.sleep(2 ** attempt)
+
+def get_github_stats(session, owner_repo):
     url = f"https://api.github.com/repos/{owner_repo}"
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    response = requests.get(url, headers=headers)
+    response = get_with_backoff(session, url, headers=GITHUB_HEADERS)
     if response.status_code == 200:
         data = response.json()
         return {
@@ -49,10 +82,10 @@ def get_github_stats(owner_repo):
         print(f"Error fetching {owner_repo}: {response.status_code}")
         return {"stars": 0, "forks": 0, "watchers": 0}
 
-def get_so_question_count(tag):
+def get_so_question_count(session, tag):
     url = f"https://api.stackexchange.com/2.3/tags/{tag}/info"
     params = {"site": "stackoverflow"}
-    response = requests.get(url, params=params)
+    response = get_with_backoff(session, url, params=params)
     if response.status_code == 200:
         data = response.json()
         return data["items"][0]["count"] if data["items"] else 0
@@ -60,27 +93,24 @@ def get_so_question_count(tag):
         print(f"Error fetching SO tag {tag}: {response.status_code}")
         return 0
 
-# ---------- Main Tracking Function ----------
-def track_mojo_popularity():
+# ---------- Main Tracking Functions ----------
+def track_once(writer):
+    """Collect today's stats and write one row, stamped with today's date, to a csv.writer."""
     date = datetime.now().strftime("%Y-%m-%d")
     
-    # GitHub
-    github_data = {}
-    total_stars = 0
-    for repo in GITHUB_REPOS:
-        stats = get_github_stats(repo)
-        github_data[repo] = stats
-        total_stars += stats["stars"]
-        time.sleep(1.1)
+    # GitHub (repos fetched concurrently)
+    with ThreadPoolExecutor(max_workers=len(GITHUB_REPOS)) as executor:
+        stats_list = executor.map(lambda repo: get_github_stats(_SESSION, repo), GITHUB_REPOS)
+        github_data = dict(zip(GITHUB_REPOS, stats_list))
+    total_stars = sum(stats["stars"] for stats in github_data.values())
     
     # Stack Overflow
-    so_counts = {tag: get_so_question_count(tag) for tag in SO_TAGS}
+    so_counts = {tag: get_so_question_count(_SESSION, tag) for tag in SO_TAGS}
     total_so_questions = sum(so_counts.values())
-    time.sleep(1)
     
     # Google Trends
     try:
-        pytrends = TrendReq(hl='en-US', tz=360)
+        pytrends = get_pytrends()
         pytrends.build_payload([TRENDS_KEYWORD], timeframe='today 3-m')
         recent_df = pytrends.interest_over_time()
         current_trends_score = recent_df[TRENDS_KEYWORD].mean() if not recent_df.empty else 0
@@ -88,25 +118,25 @@ def track_mojo_popularity():
         print("Google Trends failed:", e)
         current_trends_score = 0
     
-    # Row
-    row = {
-        "date": date,
-        "total_github_stars": total_stars,
-        "so_questions": total_so_questions,
-        "google_trends_score": round(current_trends_score, 2),
-        "details_github": json.dumps(github_data),
-        "details_so": json.dumps(so_counts)
-    }
+    # Row (same order as FIELDS)
+    writer.writerow((
+        date,
+        total_stars,
+        total_so_questions,
+        round(current_trends_score, 2),
+        json.dumps(github_data),
+        json.dumps(so_counts),
+    ))
     
-    # Append
+    print(f"[{date}] Tracked → GitHub stars: {total_stars} | SO questions: {total_so_questions} | Trends: {current_trends_score:.2f}")
+
+def track_mojo_popularity():
     file_exists = os.path.isfile(CSV_FILE)
     with open(CSV_FILE, "a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=row.keys())
+        writer = csv.writer(f)
         if not file_exists:
-            writer.writeheader()
-        writer.writerow(row)
-    
-    print(f"[{date}] Tracked → GitHub stars: {total_stars} | SO questions: {total_so_questions} | Trends: {current_trends_score:.2f}")
+            writer.writerow(FIELDS)
+        track_once(writer)
 
 # ---------- Plot ----------
 def plot_trends():
@@ -114,8 +144,13 @@ def plot_trends():
         print("No data yet.")
         return
     
-    df = pd.read_csv(CSV_FILE, parse_dates=["date"])
-    df = df.sort_values("date")
+    # A few hundred rows at most: plain csv is plenty, no pandas import needed
+    with open(CSV_FILE, newline="", encoding="utf-8") as f:
+        rows = sorted(csv.DictReader(f), key=lambda r: r["date"])  # ISO dates sort lexicographically
+    dates = [r["date"] for r in rows]
+    stars = [int(r["total_github_stars"]) for r in rows]
+    so_questions = [int(r["so_questions"]) for r in rows]
+    trends_scores = [float(r["google_trends_score"]) for r in rows]
     
     fig = make_subplots(
         rows=3, cols=1,
@@ -127,9 +162,9 @@ def plot_trends():
         vertical_spacing=0.08
     )
     
-    fig.add_trace(go.Scatter(x=df["date"], y=df["total_github_stars"], mode="lines+markers", line=dict(color="#636EFA")), row=1, col=1)
-    fig.add_trace(go.Scatter(x=df["date"], y=df["so_questions"], mode="lines+markers", line=dict(color="#EF553B")), row=2, col=1)
-    fig.add_trace(go.Scatter(x=df["date"], y=df["google_trends_score"], mode="lines+markers", line=dict(color="#00CC96")), row=3, col=1)
+    fig.add_trace(go.Scatter(x=dates, y=stars, mode="lines+markers", line=dict(color="#636EFA")), row=1, col=1)
+    fig.add_trace(go.Scatter(x=dates, y=so_questions, mode="lines+markers", line=dict(color="#EF553B")), row=2, col=1)
+    fig.add_trace(go.Scatter(x=dates, y=trends_scores, mode="lines+markers", line=dict(color="#00CC96")), row=3, col=1)
     
     fig.update_layout(height=900, title_text="Mojo Programming Language Popularity Over Time", showlegend=False, template="plotly_dark")
     fig.update_xaxes(title_text="Date", row=3, col=1)
@@ -1,5 +1,10 @@
 """Day 1 - Rotation/Dial Problem"""
 
+from array import array
+from functools import lru_cache
+from itertools import accumulate
+from pathlib import Path
+
 INITIAL_POSITION = 50
 N_POSITION = 100
 
@@ -7,24 +12,27 @@ INPUT_FILE = "day1_input.txt"
 INPUT_TEST_FILE = "day1_input_test.txt"
 
 
+@lru_cache(maxsize=8)
+def _parse_rotations(filename, mtime_ns):
+    """Parse a rotations file; cached per (filename, mtime).
+
+    Stored as a packed array('i') (4 bytes per rotation, not a boxed int each).
+    """
+    tokens = Path(filename).read_text().split()  # also drops blank lines
+    return array("i", (-int(t[1:]) if t[0] == "L" else int(t[1:]) for t in tokens))
+
+
 def load_rotations(filename):
     """Load rotations from file. L prefix = negative, R prefix = positive."""
-    rotations = []
-    with open(filename, "r") as file:
-        for line in file:
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith("L"):
-                rotations.append(-int(line[1:]))
-            else:
-                rotations.append(int(line[1:]))
-    return rotations
+    # Slice copy (a memcpy) so callers cannot mutate the cached array
+    return _parse_rotations(filename, Path(filename).stat().st_mtime_ns)[:]
 
 
-def update_position(current_position, rotation, n_position):
-    """Update position with modular arithmetic to handle wrapping."""
-    return (current_position + rotation) % n_position
+def dial_positions(rotations, initial_position, n_position):
+    """Return the dial position after each rotation (prefix sum, wrapped)."""
+    return [
+        (initial_position + total) % n_position for total in accumulate(rotations)
+    ]
 
 
 def main():
@@ -43,30 +51,21 @@ def main():
     print(f"Info - number of rotations: {len(rotations)}")
 
     # Calculate min/max rotations
-    max_rotation = rotations[0]
-    min_rotation = rotations[0]
-    for rotation in rotations:
-        if rotation > max_rotation:
-            max_rotation = rotation
-        if rotation < min_rotation:
-            min_rotation = rotation
+    max_rotation = max(rotations)
+    min_rotation = min(rotations)
 
     print(f"Info - max rotations: {max_rotation}; min rotations: {min_rotation}")
 
-    current_position = INITIAL_POSITION
-    count_zeros = 0
-
     print(f"The dial starts by pointing at {INITIAL_POSITION}")
 
-    for rotation in rotations:
-        current_position = update_position(current_position, rotation, N_POSITION)
-        if current_position == 0:
-            count_zeros += 1
+    positions = dial_positions(rotations, INITIAL_POSITION, N_POSITION)
+    count_zeros = positions.count(0)
 
-        if debug:
+    if debug:
+        for rotation, position in zip(rotations, positions):
             direction = "L" if rotation < 0 else "R"
             print(
-                f"The dial is rotated {direction}{abs(rotation)} to point at {current_position}"
+                f"The dial is rotated {direction}{abs(rotation)} to point at {position}"
             )
 
     print(f"Password: {count_zeros}")
@@ -25,20 +25,14 @@ print(f"Info - max rotations: {max(rotations)}; min rotations: {min(rotations)}"
 
 current_position = INITIAL_POSITION
 count_zeros = 0
-count_all_zeros = 0
 
 print(f"The dial starts by pointing at {INITIAL_POSITION}.")
 
 for rotation in rotations:
+    # Python's % already wraps negatives into [0, N_POSITION) - no branches needed
+    current_position = (current_position + rotation) % N_POSITION
+    count_zeros += current_position == 0
     n_revolution = abs(rotation // N_POSITION)
-    current_position = current_position + rotation % N_POSITION
-    if current_position >= N_POSITION:
-        current_position = current_position - N_POSITION
-    if current_position < 0:
-        current_position = N_POSITION + current_position
-    if current_position == 0:
-        count_zeros += 1
-    count_all_zeros = count_all_zeros + n_revolution
     if True:
         if rotation < 0:
             print(
@@ -49,6 +43,6 @@ for rotation in rotations:
                 f"The dial is rotated R{rotation} to point at {current_position} - with {n_revolution} revolutions."
             )
 
-count_all_zeros = count_all_zeros + count_zeros
+count_all_zeros = sum(abs(rotation // N_POSITION) for rotation in rotations) + count_zeros
 
 print(f"Password [old]: {count_zeros} - [new]: {count_all_zeros}")
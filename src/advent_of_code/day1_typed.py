@@ -1,6 +1,10 @@
 """Day 1 - Rotation/Dial Problem"""
 
-from typing import List
+from array import array
+from functools import lru_cache
+from itertools import accumulate
+from pathlib import Path
+from typing import List, Sequence
 
 INITIAL_POSITION: int = 50
 N_POSITION: int = 100
@@ -9,26 +13,29 @@ INPUT_FILE: str = "day1_input.txt"
 INPUT_TEST_FILE: str = "day1_input_test.txt"
 
 
-def load_rotations(filename: str) -> List[int]:
+@lru_cache(maxsize=8)
+def _parse_rotations(filename: str, mtime_ns: int) -> array[int]:
+    """Parse a rotations file; cached per (filename, mtime).
+
+    Stored as a packed array('i') (4 bytes per rotation, not a boxed int each).
+    """
+    tokens: List[str] = Path(filename).read_text().split()  # also drops blank lines
+    return array("i", (-int(t[1:]) if t[0] == "L" else int(t[1:]) for t in tokens))
+
+
+def load_rotations(filename: str) -> array[int]:
     """Load rotations from file. L prefix = negative, R prefix = positive."""
-    rotations: List[int] = []
-    with open(filename, "r") as file:
-        for line in file:
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith("L"):
-                rotations.append(-int(line[1:]))
-            else:
-                rotations.append(int(line[1:]))
-    return rotations
-
-
-def update_position(
-    current_position: int, rotation: int, n_position: int
-) -> int:
-    """Update position with modular arithmetic to handle wrapping."""
-    return (current_position + rotation) % n_position
+    # Slice copy (a memcpy) so callers cannot mutate the cached array
+    return _parse_rotations(filename, Path(filename).stat().st_mtime_ns)[:]
+
+
+def dial_positions(
+    rotations: Sequence[int], initial_position: int, n_position: int
+) -> List[int]:
+    """Return the dial position after each rotation (prefix sum, wrapped)."""
+    return [
+        (initial_position + total) % n_position for total in accumulate(rotations)
+    ]
 
 
 def main() -> None:
@@ -36,7 +43,7 @@ def main() -> None:
     debug: bool = True  # Toggle this flag to enable verbose debugging output and use the test input file.
 
     input_file: str = INPUT_TEST_FILE if debug else INPUT_FILE
-    rotations: List[int] = load_rotations(input_file)
+    rotations: array[int] = load_rotations(input_file)
 
     if debug:
         print(
@@ -47,32 +54,23 @@ def main() -> None:
     print(f"Info - number of rotations: {len(rotations)}")
 
     # Calculate min/max rotations
-    max_rotation: int = rotations[0]
-    min_rotation: int = rotations[0]
-    for rotation in rotations:
-        if rotation > max_rotation:
-            max_rotation = rotation
-        if rotation < min_rotation:
-            min_rotation = rotation
+    max_rotation: int = max(rotations)
+    min_rotation: int = min(rotations)
 
     print(
         f"Info - max rotations: {max_rotation}; min rotations: {min_rotation}"
     )
 
-    current_position: int = INITIAL_POSITION
-    count_zeros: int = 0
-
     print(f"The dial starts by pointing at {INITIAL_POSITION}")
 
-    for rotation in rotations:
-        current_position = update_position(current_position, rotation, N_POSITION)
-        if current_position == 0:
-            count_zeros += 1
+    positions: List[int] = dial_positions(rotations, INITIAL_POSITION, N_POSITION)
+    count_zeros: int = positions.count(0)
 
-        if debug:
+    if debug:
+        for rotation, position in zip(rotations, positions):
             direction: str = "L" if rotation < 0 else "R"
             print(
-                f"The dial is rotated {direction}{abs(rotation)} to point at {current_position}"
+                f"The dial is rotated {direction}{abs(rotation)} to point at {position}"
             )
 
     print(f"Password: {count_zeros}")
@@ -0,0 +1,70 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Monte Carlo path loop as a C extension (optional fallback to Numba).
+
+Build in place with:
+
+    python build_mc.py
+
+The loop calls libm directly and uses a small inline SplitMix64 generator,
+so the only Python boundary is the single call into `payoff_sums`.
+"""
+
+from libc.math cimport cos, exp, log, sin, sqrt, M_PI
+from libc.stdint cimport uint64_t
+
+
+cdef inline uint64_t _splitmix64(uint64_t* state) noexcept nogil:
+    state[0] += 0x9E3779B97F4A7C15ULL
+    cdef uint64_t z = state[0]
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL
+    return z ^ (z >> 31)
+
+
+cdef inline double _uniform(uint64_t* state) noexcept nogil:
+    """Uniform double in (0, 1] (never zero, so log() is safe)."""
+    return ((_splitmix64(state) >> 11) + 1) * (1.0 / 9007199254740992.0)
+
+
+cdef inline double _pair_payoff(double spot, double mirrored_spot, double strike,
+                                double drift, double vol_sqrt_t, double z) noexcept nogil:
+    """Average call payoff of the antithetic pair (z, -z), using one exp."""
+    cdef double growth = exp(drift + vol_sqrt_t * z)
+    cdef double up = spot * growth - strike
+    cdef double down = mirrored_spot / growth - strike
+    return 0.5 * ((up if up > 0.0 else 0.0) + (down if down > 0.0 else 0.0))
+
+
+def payoff_sums(double spot, double strike, double drift, double vol_sqrt_t,
+                long long num_pairs, unsigned long long seed=42):
+    """Return (sum, sum of squares) of payoffs over `num_pairs` antithetic pairs."""
+    cdef uint64_t state = seed
+    # exp(drift - v*z) == exp(2*drift) / exp(drift + v*z)
+    cdef double mirrored_spot = spot * exp(2.0 * drift)
+    cdef double payoff_sum = 0.0
+    cdef double payoff_squared_sum = 0.0
+    cdef double r, theta, payoff
+    cdef long long i
+
+    with nogil:
+        i = 0
+        while i < num_pairs:
+            # Box-Muller: one log/sqrt yields two normals (cos and sin halves)
+            r = sqrt(-2.0 * log(_uniform(&state)))
+            theta = 2.0 * M_PI * _uniform(&state)
+
+            payoff = _pair_payoff(spot, mirrored_spot, strike, drift, vol_sqrt_t,
+                                  r * cos(theta))
+            payoff_sum += payoff
+            payoff_squared_sum += payoff * payoff
+            i += 1
+
+            if i < num_pairs:
+                payoff = _pair_payoff(spot, mirrored_spot, strike, drift, vol_sqrt_t,
+                                      r * sin(theta))
+                payoff_sum += payoff
+                payoff_squared_sum += payoff * payoff
+                i += 1
+
+    return payoff_sum, payoff_squared_sum
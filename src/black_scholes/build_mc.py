@@ -0,0 +1,32 @@
+"""
+Build the optional Cython Monte Carlo kernel (`_mc.pyx`) in place.
+
+Run with:
+
+    python build_mc.py
+
+Requires `cython` and a C compiler. Once built, `monte_carlo_options.py`
+uses it automatically when Numba is not installed.
+"""
+
+import os
+from pathlib import Path
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+HERE = Path(__file__).parent.resolve()
+
+extension = Extension(
+    "_mc",
+    ["_mc.pyx"],
+    extra_compile_args=["-O3", "-ffast-math", "-march=native"],
+)
+
+if __name__ == "__main__":
+    os.chdir(HERE)  # build_ext --inplace writes next to the current directory
+    setup(
+        name="black-scholes-mc",
+        ext_modules=cythonize([extension]),
+        script_args=["build_ext", "--inplace"],
+    )
@@ -1,8 +1,11 @@
 """
-Monte Carlo Option Pricing - Pure Python implementation
+Monte Carlo Option Pricing - Python implementation (CuPy, Numba, Cython or NumPy backend)
 
 Prices European call options using Monte Carlo simulation.
 Computation-heavy problem ideal for demonstrating Mojo's advantages.
+The path loop never runs in the Python interpreter: it goes to a CUDA GPU
+via CuPy when available, else a fused parallel Numba kernel, else the
+Cython extension (`_mc.pyx`), else vectorised NumPy blocks.
 
 Common use cases:
 - Financial derivatives pricing
@@ -12,9 +15,184 @@ Common use cases:
 """
 
 import time
-import random
 import math
 
+import numpy as np
+
+try:
+    import cupy as cp
+
+    if not cp.cuda.is_available():
+        cp = None
+except ImportError:  # CuPy is optional; used only when a CUDA GPU is present
+    cp = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to the C extension or NumPy
+    njit = None
+
+try:
+    from _mc import payoff_sums as _mc_c_payoff_sums  # built by build_mc.py
+except ImportError:
+    _mc_c_payoff_sums = None
+
+# Antithetic pairs simulated per NumPy block; keeps the float64 temporaries cache-sized
+CHUNK_SIZE = 1_000_000
+
+# Antithetic pairs per parallel work item in the Numba kernel
+KERNEL_CHUNK_SIZE = 65_536
+
+# Antithetic pairs per CuPy block; float32 on the GPU, so 64 MB per temporary
+GPU_CHUNK_SIZE = 16_777_216
+
+
+def _payoff_sums_numpy(
+    spot: float,
+    strike: float,
+    drift: float,
+    vol_sqrt_t: float,
+    num_pairs: int,
+) -> tuple[float, float]:
+    """Return (sum, sum of squares) of antithetic-pair payoffs using NumPy blocks."""
+    rng = np.random.default_rng(42)
+    # exp(drift - v*z) == exp(2*drift) / exp(drift + v*z): one exp per pair
+    mirrored_spot = spot * math.exp(2.0 * drift)
+    payoff_sum = 0.0
+    payoff_squared_sum = 0.0
+    
+    # Simulate antithetic (z, -z) path pairs, one block at a time
+    for start in range(0, num_pairs, CHUNK_SIZE):
+        n = min(CHUNK_SIZE, num_pairs - start)
+        z = rng.standard_normal(n, dtype=np.float64)
+        
+        # Average payoff of each pair for the whole block
+        growth = np.exp(drift + vol_sqrt_t * z)
+        payoff = 0.5 * (
+            np.maximum(spot * growth - strike, 0.0)
+            + np.maximum(mirrored_spot / growth - strike, 0.0)
+        )
+        payoff_sum += float(payoff.sum())
+        payoff_squared_sum += float(payoff @ payoff)
+    
+    return payoff_sum, payoff_squared_sum
+
+
+def _payoff_sums_cupy(
+    spot: float,
+    strike: float,
+    drift: float,
+    vol_sqrt_t: float,
+    num_pairs: int,
+) -> tuple[float, float]:
+    """Return (sum, sum of squares) of antithetic-pair payoffs on a CUDA GPU.
+
+    Elementwise math runs in float32 (its rounding error is far below the
+    O(1/sqrt(n)) Monte Carlo error); the reductions accumulate in float64.
+    """
+    rng = cp.random.default_rng(42)
+    mirrored_spot = spot * math.exp(2.0 * drift)
+    payoff_sum = 0.0
+    payoff_squared_sum = 0.0
+    
+    for start in range(0, num_pairs, GPU_CHUNK_SIZE):
+        n = min(GPU_CHUNK_SIZE, num_pairs - start)
+        z = rng.standard_normal(n, dtype=cp.float32)
+        
+        growth = cp.exp(cp.float32(drift) + cp.float32(vol_sqrt_t) * z)
+        payoff = cp.float32(0.5) * (
+            cp.maximum(cp.float32(spot) * growth - cp.float32(strike), 0)
+            + cp.maximum(cp.float32(mirrored_spot) / growth - cp.float32(strike), 0)
+        )
+        payoff_sum += float(payoff.sum(dtype=cp.float64))
+        payoff_squared_sum += float((payoff * payoff).sum(dtype=cp.float64))
+    
+    return payoff_sum, payoff_squared_sum
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mc_kernel(spot, strike, drift, vol_sqrt_t, num_pairs, seed):
+        """Numba kernel: simulate antithetic pairs in parallel chunks, no temporaries.
+
+        Draw, exp, payoff and both running sums are fused into one pass per
+        chunk, so no path arrays are materialised. Each chunk reseeds its
+        thread's generator with seed + chunk index, making results
+        reproducible regardless of thread count or scheduling, and
+        accumulates into its own slot of the partial-sum arrays, which are
+        reduced once at the end.
+        """
+        mirrored_spot = spot * math.exp(2.0 * drift)
+        n_chunks = (num_pairs + KERNEL_CHUNK_SIZE - 1) // KERNEL_CHUNK_SIZE
+        partial_sums = np.zeros(n_chunks)
+        partial_squared_sums = np.zeros(n_chunks)
+        
+        for k in prange(n_chunks):
+            lo = k * KERNEL_CHUNK_SIZE
+            hi = min(lo + KERNEL_CHUNK_SIZE, num_pairs)
+            np.random.seed(seed + k)
+            payoff_sum = 0.0
+            payoff_squared_sum = 0.0
+            for _ in range(lo, hi):
+                z = np.random.standard_normal()
+                growth = math.exp(drift + vol_sqrt_t * z)
+                up = spot * growth - strike
+                down = mirrored_spot / growth - strike
+                payoff = 0.5 * (max(up, 0.0) + max(down, 0.0))
+                payoff_sum += payoff
+                payoff_squared_sum += payoff * payoff
+            partial_sums[k] = payoff_sum
+            partial_squared_sums[k] = payoff_squared_sum
+        
+        return partial_sums.sum(), partial_squared_sums.sum()
+
+    # Compile once at import so the first timed call measures simulation only
+    _mc_kernel(100.0, 100.0, 0.0, 0.2, 1, 42)
+else:
+    _mc_kernel = None
+
+
+def _phi(x: float) -> float:
+    """Standard normal CDF via math.erf (avoids importing scipy.stats)."""
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+
+# What bounds each backend's run time, for the summary `main()` prints
+_BOTTLENECKS = {
+    "CuPy (GPU)": (
+        "Bottleneck: GPU memory bandwidth through float32 block temporaries (z, growth, payoff)",
+        "Each antithetic pair requires: normal draw, exp, divide, 2× max operations",
+        "Mojo can fuse these into one kernel with no temporaries",
+    ),
+    "Numba": (
+        "Bottleneck: per-path math (normal draw + exp) in one fused parallel pass",
+        "No path arrays are materialised; chunks run across cores with prange",
+        "Mojo compiles the same fused loop ahead of time, with explicit SIMD",
+    ),
+    "Cython": (
+        "Bottleneck: per-path math (SplitMix64 normal draw + exp) on a single core",
+        "One fused pass in C calling libm, with no temporaries",
+        "Mojo adds SIMD and multi-core parallelism to the same loop",
+    ),
+    "NumPy": (
+        "Bottleneck: memory traffic through NumPy temporaries (z, growth, payoff)",
+        "Each antithetic pair requires: normal draw, exp, divide, 2× max operations",
+        "Mojo fuses these into a single pass with no temporaries",
+    ),
+}
+
+
+def backend_name() -> str:
+    """Name of the path-simulation backend monte_carlo_option_price_python uses."""
+    if cp is not None:
+        return "CuPy (GPU)"
+    if _mc_kernel is not None:
+        return "Numba"
+    if _mc_c_payoff_sums is not None:
+        return "Cython"
+    return "NumPy"
+
 
 def monte_carlo_option_price_python(
     spot: float,
@@ -33,50 +211,52 @@ def monte_carlo_option_price_python(
         risk_free_rate: Risk-free interest rate (annualized)
         volatility: Volatility (annualized)
         time_to_maturity: Time to expiration (years)
-        num_simulations: Number of Monte Carlo paths
+        num_simulations: Number of Monte Carlo paths, simulated as
+            num_simulations // 2 antithetic (z, -z) pairs
         
     Returns:
         (option_price, standard_error)
     """
-    random.seed(42)
-    
     # Pre-compute constants
     drift = (risk_free_rate - 0.5 * volatility * volatility) * time_to_maturity
     vol_sqrt_t = volatility * math.sqrt(time_to_maturity)
     discount = math.exp(-risk_free_rate * time_to_maturity)
     
-    payoff_sum = 0.0
-    payoff_squared_sum = 0.0
+    # Antithetic pairs halve the draws needed for a given standard error
+    num_pairs = max(num_simulations // 2, 1)
     
-    # Simulate stock price paths
-    for _ in range(num_simulations):
-        # Generate standard normal random variable (Box-Muller transform)
-        u1 = random.random()
-        u2 = random.random()
-        z = math.sqrt(-2.0 * math.log(u1)) * math.cos(2.0 * math.pi * u2)
-        
-        # Calculate terminal stock price
-        st = spot * math.exp(drift + vol_sqrt_t * z)
-        
-        # Calculate payoff
-        payoff = max(st - strike, 0.0)
-        payoff_sum += payoff
-        payoff_squared_sum += payoff * payoff
+    if cp is not None:
+        payoff_sum, payoff_squared_sum = _payoff_sums_cupy(
+            spot, strike, drift, vol_sqrt_t, num_pairs
+        )
+    elif _mc_kernel is not None:
+        payoff_sum, payoff_squared_sum = _mc_kernel(
+            spot, strike, drift, vol_sqrt_t, num_pairs, 42
+        )
+    elif _mc_c_payoff_sums is not None:
+        payoff_sum, payoff_squared_sum = _mc_c_payoff_sums(
+            spot, strike, drift, vol_sqrt_t, num_pairs, 42
+        )
+    else:
+        payoff_sum, payoff_squared_sum = _payoff_sums_numpy(
+            spot, strike, drift, vol_sqrt_t, num_pairs
+        )
     
     # Calculate option price (discounted expected payoff)
-    mean_payoff = payoff_sum / num_simulations
+    mean_payoff = payoff_sum / num_pairs
     option_price = discount * mean_payoff
     
-    # Calculate standard error
-    variance = (payoff_squared_sum / num_simulations) - (mean_payoff * mean_payoff)
-    standard_error = discount * math.sqrt(variance / num_simulations)
+    # Calculate standard error from the variance of the pair averages
+    variance = (payoff_squared_sum / num_pairs) - (mean_payoff * mean_payoff)
+    standard_error = discount * math.sqrt(variance / num_pairs)
     
     return option_price, standard_error
 
 
 def main():
+    backend = backend_name()
     print("=" * 70)
-    print("Monte Carlo Option Pricing - Pure Python Implementation")
+    print(f"Monte Carlo Option Pricing - Python ({backend}) Implementation")
     print("=" * 70)
     
     # Option parameters (typical equity option)
@@ -94,6 +274,7 @@ def main():
     print(f"  Volatility (σ):        {volatility*100:.1f}%")
     print(f"  Time to maturity (T):  {time_to_maturity:.1f} years")
     print(f"  Simulations:           {num_simulations:,}")
+    print(f"  Backend:               {backend}")
     
     print("\nRunning Monte Carlo simulation...")
     start = time.time()
@@ -113,17 +294,14 @@ def main():
     print(f"{'  Simulations/sec:':<25} {num_simulations/elapsed:,.0f}")
     
     print("\n" + "=" * 70)
-    print("Bottleneck: Python interpreter overhead on math-heavy loops")
-    print("Each path requires: exp, sqrt, log, cos, max operations")
-    print("Potential speedup with Mojo: 50-200×")
+    for line in _BOTTLENECKS[backend]:
+        print(line)
     print("=" * 70)
     
     # Black-Scholes analytical price for comparison
-    from scipy.stats import norm
-    
     d1 = (math.log(spot/strike) + (risk_free_rate + 0.5*volatility**2)*time_to_maturity) / (volatility * math.sqrt(time_to_maturity))
     d2 = d1 - volatility * math.sqrt(time_to_maturity)
-    bs_price = spot * norm.cdf(d1) - strike * math.exp(-risk_free_rate * time_to_maturity) * norm.cdf(d2)
+    bs_price = spot * _phi(d1) - strike * math.exp(-risk_free_rate * time_to_maturity) * _phi(d2)
     
     print(f"\nBlack-Scholes Price: ${bs_price:.4f}")
     print(f"Monte Carlo Error:   ${abs(price - bs_price):.4f} ({abs(price-bs_price)/bs_price*100:.2f}%)")
@@ -16,8 +16,10 @@ import sys
 from pathlib import Path
 import mojo.importer
 
-MOJO_IMPORT_PATH = Path(__file__).resolve().parents[2] / "src" / "docs_person_example"
-sys.path.insert(0, str(MOJO_IMPORT_PATH))
+# This file lives next to `person_module.mojo`, so its own directory is the import path
+MOJO_IMPORT_PATH = str(Path(__file__).parent.resolve())
+if MOJO_IMPORT_PATH not in sys.path:
+    sys.path.insert(0, MOJO_IMPORT_PATH)
 
 import person_module
 
@@ -4,20 +4,28 @@ Grid Evolution Benchmark Suite — Config-Driven Multi-Version Support
 Benchmarks all implementations defined in benchmark_config.toml
 """
 
+import argparse
 import csv
 import hashlib
 import importlib
-import random
+import multiprocessing
+import os
+import queue
+import re
 import subprocess
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
 
 import numpy as np
 import tomllib
 from loguru import logger
 
+from grid_fingerprint import fingerprint_str
+
 # === Load config ===
 SCRIPT_DIR = Path(__file__).parent.resolve()
 CONFIG_FILE = SCRIPT_DIR / "benchmark_config.toml"
@@ -59,6 +67,20 @@ LOG_LEVEL = o.get("log_level", "INFO")
 # Mojo template - single file for all versions
 MOJO_TEMPLATE = SCRIPT_DIR / "run_grid_bench.mojo"
 
+# Compiled Mojo runners, keyed by a hash of their source, the local .mojo
+# modules they import, the compiler version and the build flags
+MOJO_CACHE_DIR = SCRIPT_DIR / ".mojo_cache"
+
+# Extra `mojo build` flags (part of the cache key)
+MOJO_BUILD_ARGS = []
+
+# `import x` / `from x import ...` lines; local modules are followed for the cache key
+MOJO_IMPORT = re.compile(r"^\s*(?:from|import)\s+(\w+)", re.MULTILINE)
+
+# `alias name = value` lines in the template, and the config values that override them
+ALIAS_LINE = re.compile(r"^\s*alias\s+(\w+)\s*=.*$", re.MULTILINE)
+MOJO_ALIASES = {key: value for key, value in b.items() if key != "seed"}
+
 # Implementations from config
 IMPLEMENTATIONS = cfg.get("implementations", [])
 
@@ -76,156 +98,211 @@ def trunc(s: str, n: int = 16) -> str:
 
 
 def generate_initial_grid():
-    random.seed(SEED)
-    np.random.seed(SEED)
-    data = [[random.randint(0, 1) for _ in range(COLS)] for _ in range(ROWS)]
-    with open(INITIAL_GRID_CSV, "w", newline="") as f:
-        csv.writer(f).writerows(data)
+    """Write the seeded initial grid CSV (read by Mojo) and return it as uint8 ndarray."""
+    rng = np.random.default_rng(SEED)
+    grid = rng.integers(0, 2, size=(ROWS, COLS), dtype=np.uint8)
+    np.savetxt(INITIAL_GRID_CSV, grid, fmt="%d", delimiter=",")
     logger.info(f"Generated initial grid: {ROWS}×{COLS}, seed={SEED}")
-    return data
+    return grid
 
 
-# === Benchmark Runner ===
-class BenchmarkRunner:
-    def __init__(self):
-        self.results = {}  # name -> {time, description, type}
-        self.fingerprints = {}
-        self.run_timestamp = datetime.now().strftime(CSV_TIMESTAMP_FMT)
+# === Implementation runners ===
+# Top-level functions (rather than methods) so they can run in worker processes.
+# Each returns (name, result, fingerprint) and raises on failure.
+class BenchmarkError(Exception):
+    """An implementation failed to build, run or report its results."""
 
-    def run_python_impl(self, impl_config):
-        """Run a Python implementation."""
-        name = impl_config["name"]
-        module_name = impl_config["module"]
-        class_name = impl_config["class"]
-        description = impl_config.get("description", "")
-        
-        logger.info(f"Running {name}...")
-        print(f"Running {name}...", end="", flush=True)
-        
-        try:
-            module = importlib.import_module(module_name)
-            GridCls = getattr(module, class_name)
-            
-            # Load data
-            if "np" in module_name.lower() or "numpy" in name.lower():
-                grid = GridCls(np.loadtxt(INITIAL_GRID_CSV, delimiter=",", dtype=np.uint8))
-            else:
-                random.seed(SEED)
-                initial_data = [[random.randint(0, 1) for _ in range(COLS)] for _ in range(ROWS)]
-                grid = GridCls(ROWS, COLS, initial_data)
-            
-            # Warmup
-            for _ in range(WARMUP):
-                grid = grid.evolve()
-            
-            # Benchmark
-            start = time.perf_counter()
-            for _ in range(GENS):
-                grid = grid.evolve()
-            duration = time.perf_counter() - start
-            
-            self.results[name] = {
-                "time": duration,
-                "type": "python",
-                "description": description,
-            }
-            self.fingerprints[name] = grid.fingerprint()
-            
-            logger.info(f"{name}: {duration:.6f}s")
-            print(f" → {duration:.6f} s")
-            
-        except Exception as e:
-            logger.error(f"{name} failed: {e}")
-            print(f" FAILED: {e}")
-
-    def run_mojo_impl(self, impl_config):
-        """Run a Mojo implementation using template replacement."""
-        name = impl_config["name"]
-        grid_module = impl_config["grid_module"]
-        description = impl_config.get("description", "")
-        
-        logger.info(f"Running {name}...")
-        print(f"Running {name}...", end="", flush=True)
-        
-        if not MOJO_TEMPLATE.exists():
-            logger.error(f"Template not found: {MOJO_TEMPLATE}")
-            print(f" FAILED: Template not found")
-            return
-        
-        # Read template
-        code = MOJO_TEMPLATE.read_text()
-        
-        # Replace import statement
-        code = code.replace("from gridv1 import Grid", f"from {grid_module} import Grid")
-        
-        # Replace alias values from config
-        for key, value in b.items():
-            if key in ["seed"]:  # Skip non-alias keys
-                continue
-            # Find and replace the entire alias line
-            for line in code.splitlines():
-                if line.strip().startswith(f"alias {key} ="):
-                    new_line = f"alias {key} = {value}"
-                    code = code.replace(line, new_line)
-                    break
-        
-        # Generate version-specific file
-        safe_name = name.lower().replace(" ", "_")
-        generated_path = SCRIPT_DIR / f"run_grid_bench_{safe_name}_generated.mojo"
-        generated_path.write_text(code)
-        
-        if PERSIST_MOJO:
-            persistent = SCRIPT_DIR / f"{safe_name}_{int(time.time())}.mojo"
-            persistent.write_text(code)
-            logger.debug(f"Persisted: {persistent.name}")
+
+def run_python_impl(impl_config, initial):
+    """Run a Python implementation from the shared initial grid (uint8 ndarray)."""
+    name = impl_config["name"]
+    module_name = impl_config["module"]
+    class_name = impl_config["class"]
+    description = impl_config.get("description", "")
+    # Implementations with evolve_n() can run generations in batches
+    batch = int(impl_config.get("batch_generations", 1))
+    
+    logger.info(f"Running {name}...")
+    
+    module = importlib.import_module(module_name)
+    GridCls = getattr(module, class_name)
+    
+    # Build the grid in the shape the implementation expects
+    if "np" in module_name.lower() or "numpy" in name.lower():
+        grid = GridCls(initial.copy())
+    else:
+        grid = GridCls(ROWS, COLS, initial.tolist())
+    
+    # Warmup
+    for _ in range(WARMUP):
+        grid = grid.evolve()
+    
+    # Benchmark
+    start = time.perf_counter()
+    if batch > 1:
+        full_batches, remainder = divmod(GENS, batch)
+        for _ in range(full_batches):
+            grid = grid.evolve_n(batch)
+        if remainder:
+            grid = grid.evolve_n(remainder)
+    else:
+        for _ in range(GENS):
+            grid = grid.evolve()
+    duration = time.perf_counter() - start
+    
+    logger.info(f"{name}: {duration:.6f}s")
+    if getattr(grid, "compiled", None) is False:
+        # e.g. GridMetal when torch.compile failed: these are eager timings
+        logger.warning(f"{name}: compiled step unavailable, timed the eager fallback")
+        description = f"{description} (eager fallback, not compiled)".strip()
+    result = {
+        "time": duration,
+        "type": "python",
+        "description": description,
+    }
+    return name, result, grid.fingerprint()
+
+
+@lru_cache(maxsize=1)
+def _mojo_version():
+    """`mojo --version` output (once per process), so toolchain upgrades rebuild."""
+    return subprocess.run(
+        ["mojo", "--version"], capture_output=True, text=True, timeout=60
+    ).stdout.strip()
+
+
+def _local_mojo_sources(code):
+    """The `SCRIPT_DIR` .mojo files that `code` imports, followed transitively."""
+    found = {}
+    pending = [code]
+    while pending:
+        for module in MOJO_IMPORT.findall(pending.pop()):
+            path = SCRIPT_DIR / f"{module}.mojo"
+            if path not in found and path.exists():
+                found[path] = path.read_text()
+                pending.append(found[path])
+    return sorted(found)
+
+
+def run_mojo_impl(impl_config):
+    """Run a Mojo implementation using template replacement."""
+    name = impl_config["name"]
+    grid_module = impl_config["grid_module"]
+    description = impl_config.get("description", "")
+    
+    logger.info(f"Running {name}...")
+    
+    if not MOJO_TEMPLATE.exists():
+        raise BenchmarkError(f"Template not found: {MOJO_TEMPLATE}")
+    
+    # Read template
+    code = MOJO_TEMPLATE.read_text()
+    
+    # Replace import statement
+    code = code.replace("from gridv1 import Grid", f"from {grid_module} import Grid")
+    
+    # Replace alias values from config in one pass over the template
+    code = ALIAS_LINE.sub(
+        lambda m: f"alias {m[1]} = {MOJO_ALIASES[m[1]]}" if m[1] in MOJO_ALIASES else m[0],
+        code,
+    )
+    
+    # Generate version-specific file
+    safe_name = name.lower().replace(" ", "_")
+    generated_path = SCRIPT_DIR / f"run_grid_bench_{safe_name}_generated.mojo"
+    
+    if PERSIST_MOJO:
+        persistent = SCRIPT_DIR / f"{safe_name}_{int(time.time())}.mojo"
+        persistent.write_text(code)
+        logger.debug(f"Persisted: {persistent.name}")
+    
+    try:
+        # Key the compiled binary on everything that affects it: the generated
+        # runner, every local module it (transitively) imports, the compiler
+        # version and the build flags; `mojo build` only runs when one changes
+        hasher = hashlib.sha256(code.encode())
+        for source in _local_mojo_sources(code):
+            hasher.update(source.name.encode())
+            hasher.update(source.read_bytes())
+        hasher.update(_mojo_version().encode())
+        hasher.update("\0".join(MOJO_BUILD_ARGS).encode())
+        exe = MOJO_CACHE_DIR / f"{safe_name}_{hasher.hexdigest()[:16]}"
         
-        try:
-            result = subprocess.run(
-                ["mojo", "run", str(generated_path)],
+        if not exe.exists():
+            logger.debug(f"Building {exe.name}")
+            generated_path.write_text(code)
+            MOJO_CACHE_DIR.mkdir(exist_ok=True)
+            build = subprocess.run(
+                ["mojo", "build", *MOJO_BUILD_ARGS, str(generated_path), "-o", str(exe)],
                 cwd=SCRIPT_DIR,
                 capture_output=True,
                 text=True,
                 timeout=300,
             )
-            
-            if result.returncode != 0:
-                logger.error(f"{name} failed: {result.stderr}")
-                print(f" FAILED\n{result.stderr}")
-                return
-            
-            output = result.stdout.strip()
-            if "Mojo_time:" not in output or "Mojo_fingerprint_str:" not in output:
-                logger.warning(f"{name}: incomplete output")
-                print(" WARNING: Incomplete output")
-                return
-            
-            duration = float(output.split("Mojo_time:")[1].split()[0])
-            raw_str = output.split("Mojo_fingerprint_str:")[1].strip()
-            mojo_hash = hashlib.sha256(raw_str.encode()).hexdigest()
-            
-            self.results[name] = {
-                "time": duration,
-                "type": "mojo",
-                "description": description,
-            }
-            self.fingerprints[name] = mojo_hash
-            
-            logger.info(f"{name}: {duration:.6f}s")
-            print(f" → {duration:.6f} s")
-            
-        except FileNotFoundError:
-            logger.error("mojo not found in PATH")
-            print(" ERROR: 'mojo' not found")
-        except subprocess.TimeoutExpired:
-            logger.error(f"{name} timeout")
-            print(" ERROR: Timeout")
-        finally:
-            # Cleanup if not persisting
-            if generated_path.exists() and not PERSIST_MOJO:
-                generated_path.unlink()
+            if build.returncode != 0:
+                raise BenchmarkError(f"build failed\n{build.stderr}")
+        else:
+            logger.debug(f"Using cached {exe.name}")
+        
+        # The reported time is measured inside the binary around the evolve
+        # loop; process start-up and CSV loading only show up in wall time
+        wall_start = time.perf_counter()
+        result = subprocess.run(
+            [str(exe)],
+            cwd=SCRIPT_DIR,
+            capture_output=True,
+            text=True,
+            timeout=300,
+        )
+        wall = time.perf_counter() - wall_start
+    except FileNotFoundError:
+        raise BenchmarkError("'mojo' not found in PATH") from None
+    except subprocess.TimeoutExpired:
+        raise BenchmarkError("Timeout") from None
+    finally:
+        # Cleanup if not persisting
+        if generated_path.exists() and not PERSIST_MOJO:
+            generated_path.unlink()
+    
+    if result.returncode != 0:
+        raise BenchmarkError(result.stderr)
+    
+    output = result.stdout.strip()
+    if "Mojo_time:" not in output or "Mojo_fingerprint_str:" not in output:
+        raise BenchmarkError("Incomplete output")
+    
+    duration = float(output.split("Mojo_time:")[1].split()[0])
+    raw_str = output.split("Mojo_fingerprint_str:")[1].strip()
+    
+    logger.info(f"{name}: {duration:.6f}s")
+    logger.debug(f"{name}: process wall time {wall:.3f}s (overhead {wall - duration:.3f}s)")
+    result = {
+        "time": duration,
+        "type": "mojo",
+        "description": description,
+    }
+    return name, result, fingerprint_str(raw_str)
 
-    def run_all_implementations(self):
-        """Run all enabled implementations from config."""
+
+def _pin_worker(cores):
+    """Pin a worker process to its own core so parallel timings stay comparable."""
+    try:
+        os.sched_setaffinity(0, {cores.get_nowait()})
+    except (AttributeError, queue.Empty):
+        pass  # Not Linux, or more workers than cores
+
+
+# === Benchmark Runner ===
+class BenchmarkRunner:
+    def __init__(self, parallel: int = 1):
+        self.results = {}  # name -> {time, description, type}
+        self.fingerprints = {}
+        self._init = None  # initial grid, loaded once per run
+        self.run_timestamp = datetime.now().strftime(CSV_TIMESTAMP_FMT)
+        self.parallel = parallel
+
+    def enabled_implementations(self):
+        """Yield (impl_config, runner) for every implementation that should run."""
         for impl in IMPLEMENTATIONS:
             if not impl.get("enabled", True):
                 logger.debug(f"Skipping disabled: {impl['name']}")
@@ -234,12 +311,62 @@ class BenchmarkRunner:
             impl_type = impl["type"]
             
             if impl_type == "python" and RUN_PYTHON:
-                self.run_python_impl(impl)
+                yield impl, partial(run_python_impl, initial=self._init)
             elif impl_type == "mojo" and RUN_MOJO:
-                self.run_mojo_impl(impl)
+                yield impl, run_mojo_impl
             else:
                 logger.debug(f"Skipping {impl['name']} (type={impl_type})")
 
+    def run_all_implementations(self):
+        """Run all enabled implementations from config."""
+        if self.parallel > 1:
+            self.run_all_parallel()
+            return
+        
+        for impl, runner in self.enabled_implementations():
+            print(f"Running {impl['name']}...", end="", flush=True)
+            try:
+                name, result, fp = runner(impl)
+            except Exception as e:
+                logger.error(f"{impl['name']} failed: {e}")
+                print(f" FAILED: {e}")
+                continue
+            self.results[name] = result
+            self.fingerprints[name] = fp
+            print(f" → {result['time']:.6f} s")
+
+    def run_all_parallel(self):
+        """Run implementations concurrently (suite wall time, not timing accuracy)."""
+        impls = list(self.enabled_implementations())
+        print(f"Running {len(impls)} implementations on {self.parallel} workers...")
+        
+        cores = multiprocessing.Queue()
+        for core in sorted(getattr(os, "sched_getaffinity", lambda _: ())(0)):
+            cores.put(core)
+        
+        completed = {}
+        with ProcessPoolExecutor(
+            max_workers=self.parallel, initializer=_pin_worker, initargs=(cores,)
+        ) as pool:
+            futures = {pool.submit(runner, impl): impl["name"] for impl, runner in impls}
+            for future in as_completed(futures):
+                impl_name = futures[future]
+                try:
+                    name, result, fp = future.result()
+                except Exception as e:
+                    logger.error(f"{impl_name} failed: {e}")
+                    print(f"   {impl_name}: FAILED: {e}")
+                    continue
+                completed[name] = (result, fp)
+                print(f"   {name} → {result['time']:.6f} s")
+        
+        # Keep config order: the first result is the baseline and reference
+        for impl, _ in impls:
+            if impl["name"] in completed:
+                result, fp = completed[impl["name"]]
+                self.results[impl["name"]] = result
+                self.fingerprints[impl["name"]] = fp
+
 
     def verify(self):
         """Verify all implementations produce identical results."""
@@ -321,8 +448,9 @@ class BenchmarkRunner:
         """Main benchmark execution."""
         logger.info(f"Starting benchmark run: {ROWS}×{COLS} grid, {GENS} generations")
         
-        # Generate initial grid
-        generate_initial_grid()
+        # Generate initial grid: Mojo reads the CSV, Python implementations
+        # share the in-memory copy
+        self._init = generate_initial_grid()
         
         # Run all implementations
         self.run_all_implementations()
@@ -374,6 +502,17 @@ class BenchmarkRunner:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark all configured Grid implementations")
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run up to N implementations at once, each pinned to its own core "
+        "(faster suite for iteration; use the serial default for published timings)",
+    )
+    args = parser.parse_args()
+    
     print("Grid Evolution Benchmark Suite — Config-Driven")
     print(f"Config: {CONFIG_FILE.name}")
     print(f"Results: {RESULTS_DIR}")
@@ -385,4 +524,4 @@ if __name__ == "__main__":
     logger.info(f"Grid: {ROWS}×{COLS}, Generations: {GENS}, Seed: {SEED}")
     logger.info("=" * 60)
     
-    BenchmarkRunner().run()
+    BenchmarkRunner(parallel=args.parallel).run()
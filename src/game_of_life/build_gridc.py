@@ -0,0 +1,32 @@
+"""
+Build the optional Cython Game of Life kernel (`_gridc.pyx`) in place.
+
+Run with:
+
+    python build_gridc.py
+
+Requires `cython`, `numpy` and a C compiler. Once built, `gridv1_cython.py`
+(and its "Cython" entry in `benchmark_config.toml`) can import it.
+"""
+
+import os
+from pathlib import Path
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+HERE = Path(__file__).parent.resolve()
+
+extension = Extension(
+    "_gridc",
+    ["_gridc.pyx"],
+    extra_compile_args=["-O3", "-march=native"],
+)
+
+if __name__ == "__main__":
+    os.chdir(HERE)  # build_ext --inplace writes next to the current directory
+    setup(
+        name="game-of-life-gridc",
+        ext_modules=cythonize([extension]),
+        script_args=["build_ext", "--inplace"],
+    )
@@ -0,0 +1,25 @@
+"""
+grid_fingerprint.py — Shared grid fingerprint for correctness checks
+
+Every implementation hashes its cells the same way: SHA-256 of the
+row-major 0/1 cells bit-packed MSB-first (`np.packbits`), i.e. one byte
+per 8 cells. The Mojo runner prints its cells as a flat '0'/'1' string,
+which `fingerprint_str` packs identically, so digests compare across
+languages.
+"""
+
+import hashlib
+
+import numpy as np
+
+
+def fingerprint_cells(cells) -> str:
+    """SHA-256 hex digest of a grid of 0/1 cells (array or list of lists)."""
+    packed = np.packbits(np.ascontiguousarray(cells, dtype=np.uint8))
+    return hashlib.sha256(packed.tobytes()).hexdigest()
+
+
+def fingerprint_str(flat: str) -> str:
+    """Same digest from a flat string of '0'/'1' characters."""
+    cells = np.frombuffer(flat.encode("ascii"), dtype=np.uint8) - ord("0")
+    return fingerprint_cells(cells)
@@ -1,13 +1,22 @@
 import random
-import hashlib
 from typing import List
 
+from grid_fingerprint import fingerprint_cells
+
+# Cell value (as a code point) -> display character, for str.translate
+_CELL_CHARS = {0: "░", 1: "█"}
+
 
 class Grid:
     def __init__(self, rows: int, cols: int, data: List[List[int]] | None = None):
         self.rows = rows
         self.cols = cols
         self.data = data or [[0] * cols for _ in range(rows)]
+        # Wrap-around neighbour indices, computed once rather than per cell
+        self._rm = [(r - 1) % rows for r in range(rows)]
+        self._rp = [(r + 1) % rows for r in range(rows)]
+        self._cm = [(c - 1) % cols for c in range(cols)]
+        self._cp = [(c + 1) % cols for c in range(cols)]
 
     @classmethod
     def random(cls, rows: int, cols: int):
@@ -15,38 +24,41 @@ class Grid:
         return cls(rows, cols, data)
 
     def evolve(self):
+        data = self.data
+        cm, cp = self._cm, self._cp
         next_gen = []
         for r in range(self.rows):
+            above, current, below = data[self._rm[r]], data[r], data[self._rp[r]]
             row = []
             for c in range(self.cols):
-                num_neighbors = sum(
-                    self.data[(r + dr) % self.rows][(c + dc) % self.cols]
-                    for dr in (-1, 0, 1)
-                    for dc in (-1, 0, 1)
-                    if not (dr == 0 and dc == 0)
+                left, right = cm[c], cp[c]
+                num_neighbors = (
+                    above[left] + above[c] + above[right]
+                    + current[left] + current[right]
+                    + below[left] + below[c] + below[right]
                 )
-                if self.data[r][c] == 1:
-                    new_state = 1 if num_neighbors in (2, 3) else 0
+                # Born with 3 neighbours, survives with 2 or 3
+                if num_neighbors == 3 or (num_neighbors == 2 and current[c] == 1):
+                    row.append(1)
                 else:
-                    new_state = 1 if num_neighbors == 3 else 0
-                row.append(new_state)
+                    row.append(0)
             next_gen.append(row)
         return Grid(self.rows, self.cols, next_gen)
 
     def fingerprint(self) -> str:
-        """Return SHA-256 hex digest of the grid as a flat string of 0s and 1s"""
-        flat_str = "".join(
-            "1" if cell == 1 else "0" for row in self.data for cell in row
-        )
-        return hashlib.sha256(flat_str.encode("utf-8")).hexdigest()
+        """Return SHA-256 hex digest of the grid's bit-packed cells"""
+        return fingerprint_cells(self.data)
+
+    def raw_fingerprint_bytes(self) -> bytes:
+        """Return the cells row-major, one 0/1 byte each"""
+        return b"".join(map(bytes, self.data))
 
     def __str__(self) -> str:
         """Pretty-print the grid using █ and space (or ● and . if you prefer)"""
-        lines = []
-        for row in self.data:
-            line = "".join("█" if cell == 1 else "░" for cell in row)
-            lines.append(line)
-        return "\n".join(lines)
+        # bytes(row) packs the 0/1 cells in C; translate maps them in one pass
+        return "\n".join(
+            bytes(row).decode("latin-1").translate(_CELL_CHARS) for row in self.data
+        )
 
     def __repr__(self) -> str:
         return (
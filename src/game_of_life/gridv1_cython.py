@@ -0,0 +1,57 @@
+"""
+gridv1_cython.py — Game of Life with a Cython C-extension step
+
+Same one-byte-per-cell layout as gridv1.py, with the cell loop compiled
+to C by `_gridc.pyx` (neighbour index tables instead of modulo).
+
+Requirements:
+    pip install cython numpy
+    python build_gridc.py
+"""
+
+import numpy as np
+
+from _gridc import evolve_uint8
+from grid_fingerprint import fingerprint_cells
+
+
+class GridCython:
+    """
+    Game of Life grid stepped by the `_gridc` C extension.
+
+    Two uint8 buffers are allocated once and swapped every generation,
+    so `evolve()` allocates nothing.
+    """
+
+    def __init__(self, rows: int, cols: int, data=None):
+        self.rows = rows
+        self.cols = cols
+
+        if data is not None:
+            self.data = np.array(data, dtype=np.uint8).reshape(rows, cols)
+        else:
+            self.data = np.zeros((rows, cols), dtype=np.uint8)
+        self._next = np.empty_like(self.data)
+        self._fp = None
+
+    @classmethod
+    def random(cls, rows: int, cols: int):
+        data = np.random.randint(0, 2, size=(rows, cols), dtype=np.uint8)
+        return cls(rows, cols, data)
+
+    def evolve(self):
+        """Advance one generation in place and return self."""
+        evolve_uint8(self.data, self._next)
+        self.data, self._next = self._next, self.data
+        self._fp = None
+        return self
+
+    def fingerprint(self) -> str:
+        """SHA-256 of the cells, cached until the next evolve()."""
+        if self._fp is None:
+            self._fp = fingerprint_cells(self.data)
+        return self._fp
+
+    def raw_fingerprint_bytes(self) -> bytes:
+        """Row-major cells, one 0/1 byte each."""
+        return self.data.tobytes()
@@ -1,12 +1,66 @@
 import numpy as np
 from typing import Self
-import hashlib
+
+from grid_fingerprint import fingerprint_cells
+from gridv1 import Grid
+
+
+class Workspace:
+    """Scratch buffers for stepping grids of one shape without allocating."""
+
+    def __init__(self, rows: int, cols: int):
+        self.padded = np.empty((rows + 2, cols + 2), dtype=np.uint8)
+        self.row_sums = np.empty((rows + 2, cols), dtype=np.uint8)
+        self.neighbors = np.empty((rows, cols), dtype=np.uint8)
+
+
+def next_generation(
+    data: np.ndarray,
+    out: np.ndarray | None = None,
+    work: Workspace | None = None,
+) -> np.ndarray:
+    """Apply one Conway step to a 0/1 uint8 array with wrap-around edges.
+
+    The result is written into `out` (a uint8 array shaped like `data`) if
+    given; passing a `Workspace` as well makes the step allocation-free.
+    """
+    if work is None:
+        work = Workspace(*data.shape)
+
+    # Wrap-pad into the preallocated buffer: interior, top/bottom rows, then
+    # left/right columns (which also fills the corners)
+    padded = work.padded
+    padded[1:-1, 1:-1] = data
+    padded[0, 1:-1] = data[-1]
+    padded[-1, 1:-1] = data[0]
+    padded[:, 0] = padded[:, -2]
+    padded[:, -1] = padded[:, 1]
+
+    # Separable 3×3 box sum over views of the padded grid: rows of three,
+    # then columns of those, minus the centre cell
+    row_sums = work.row_sums
+    np.add(padded[:, :-2], padded[:, 1:-1], out=row_sums)
+    row_sums += padded[:, 2:]
+    neighbors = work.neighbors
+    np.add(row_sums[:-2], row_sums[1:-1], out=neighbors)
+    neighbors += row_sums[2:]
+    neighbors -= data
+
+    # Alive next iff count == 3, or count == 2 and alive: (count | alive) == 3
+    neighbors |= data
+    if out is None:
+        out = np.empty_like(data)
+    return np.equal(neighbors, 3, out=out)
 
 
 class GridNP:
     def __init__(self, data: np.ndarray):
         self.data = data.astype(np.uint8)
         self.rows, self.cols = data.shape
+        # Ping-pong buffer: each generation is written here, then swapped in
+        self._next = np.empty_like(self.data)
+        self._work = Workspace(self.rows, self.cols)
+        self._fp = None
 
     @classmethod
     def random(cls, rows: int, cols: int) -> Self:
@@ -14,17 +68,60 @@ class GridNP:
         return cls(data)
 
     def evolve(self) -> Self:
-        # Correct wrap-around using np.roll (faster and correct)
-        neighbors = sum(
-            np.roll(np.roll(self.data, dr, 0), dc, 1)
-            for dr in (-1, 0, 1)
-            for dc in (-1, 0, 1)
-            if not (dr == 0 and dc == 0)
-        )
+        """Advance one generation in place and return self."""
+        next_generation(self.data, out=self._next, work=self._work)
+        self.data, self._next = self._next, self.data
+        self._fp = None
+        return self
+
+    def fingerprint(self) -> str:
+        """SHA-256 of the cells, cached until the next evolve()."""
+        if self._fp is None:
+            self._fp = fingerprint_cells(self.data)
+        return self._fp
+
+    def raw_fingerprint_bytes(self) -> bytes:
+        """Row-major cells, one 0/1 byte each."""
+        return self.data.tobytes()
+
 
-        new_state = (self.data == 1) & (neighbors == 2) | (neighbors == 3)
-        return GridNP(new_state.astype(np.uint8))
+class GridListNP(Grid):
+    """`gridv1.Grid` with the same list-of-lists API, evolved by the NumPy kernel.
+
+    The cells live in an ndarray between generations; `data` is only
+    rebuilt as a list of lists when a caller actually reads it.
+    """
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> Self:
+        grid = cls.__new__(cls)
+        grid.rows, grid.cols = array.shape
+        grid._np = array
+        grid._data = None
+        grid._fp = None
+        return grid
+
+    @property
+    def data(self) -> list[list[int]]:
+        if self._data is None:
+            self._data = self._np.tolist()
+        return self._data
+
+    @data.setter
+    def data(self, value: list[list[int]]) -> None:
+        self._data = value
+        self._np = np.asarray(value, dtype=np.uint8)
+        self._fp = None
+
+    def evolve(self) -> Self:
+        return type(self).from_array(next_generation(self._np))
 
     def fingerprint(self) -> str:
-        flat_str = "".join("1" if cell else "0" for cell in self.data.flat)
-        return hashlib.sha256(flat_str.encode("utf-8")).hexdigest()
+        """SHA-256 of the cells, cached until the next evolve()."""
+        if self._fp is None:
+            self._fp = fingerprint_cells(self._np)
+        return self._fp
+
+    def raw_fingerprint_bytes(self) -> bytes:
+        """Row-major cells, one 0/1 byte each."""
+        return self._np.tobytes()
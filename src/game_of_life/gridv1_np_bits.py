@@ -0,0 +1,91 @@
+import numpy as np
+from typing import Self
+
+from grid_fingerprint import fingerprint_cells
+
+
+class GridNPBits:
+    """NumPy grid packed 64 cells per uint64 word (column c -> word c // 64, bit c % 64).
+
+    Neighbour counts are bit-sliced: a full adder over the eight shifted words
+    updates every cell in a word at once, touching 1/8 of the bytes of GridNP.
+    """
+
+    def __init__(self, data: np.ndarray):
+        self.rows, self.cols = data.shape
+        self.words = (self.cols + 63) // 64
+        self.last_bits = self.cols - 64 * (self.words - 1)  # valid bits in last word
+        self.last_mask = np.uint64((1 << self.last_bits) - 1)
+
+        # Pad columns to a multiple of 64, then pack little-endian into words
+        padded = np.zeros((self.rows, self.words * 64), dtype=np.uint8)
+        padded[:, : self.cols] = data
+        self.data = (
+            np.packbits(padded, axis=1, bitorder="little").view("<u8").copy()
+        )
+        self._fp = None
+
+    @classmethod
+    def random(cls, rows: int, cols: int) -> Self:
+        data = np.random.randint(0, 2, size=(rows, cols), dtype=np.uint8)
+        return cls(data)
+
+    def _west(self, x: np.ndarray) -> np.ndarray:
+        """Each bit replaced by its left neighbour (column c - 1, wrapping)."""
+        out = (x << 1) | (np.roll(x, 1, axis=1) >> 63)
+        # Column 0 wraps to the last valid column, not the padding
+        out[:, 0] = (x[:, 0] << 1) | ((x[:, -1] >> (self.last_bits - 1)) & 1)
+        return out
+
+    def _east(self, x: np.ndarray) -> np.ndarray:
+        """Each bit replaced by its right neighbour (column c + 1, wrapping)."""
+        out = (x >> 1) | (np.roll(x, -1, axis=1) << 63)
+        # The last valid column wraps to column 0
+        out[:, -1] = (x[:, -1] >> 1) | ((x[:, 0] & 1) << (self.last_bits - 1))
+        return out
+
+    def evolve(self) -> Self:
+        x = self.data
+        west = self._west(x)
+        east = self._east(x)
+
+        neighbours = (
+            np.roll(west, 1, axis=0), np.roll(x, 1, axis=0), np.roll(east, 1, axis=0),
+            west, east,
+            np.roll(west, -1, axis=0), np.roll(x, -1, axis=0), np.roll(east, -1, axis=0),
+        )
+
+        # Bit-sliced count: s0/s1 are the low bits, s2 sticks once count >= 4
+        s0 = np.zeros_like(x)
+        s1 = np.zeros_like(x)
+        s2 = np.zeros_like(x)
+        for n in neighbours:
+            carry = s0 & n
+            s0 ^= n
+            s2 |= s1 & carry
+            s1 ^= carry
+
+        # Alive next iff count == 3, or count == 2 and alive now
+        new = s1 & ~s2 & (s0 | x)
+        new[:, -1] &= self.last_mask
+
+        grid = object.__new__(GridNPBits)
+        grid.__dict__.update(self.__dict__)
+        grid.data = new
+        grid._fp = None
+        return grid
+
+    def cells(self) -> np.ndarray:
+        """Unpack to a (rows, cols) uint8 array of 0/1 cells."""
+        bits = np.unpackbits(self.data.view(np.uint8), axis=1, bitorder="little")
+        return bits[:, : self.cols]
+
+    def fingerprint(self) -> str:
+        """SHA-256 of the cells, cached until the next evolve()."""
+        if self._fp is None:
+            self._fp = fingerprint_cells(self.cells())
+        return self._fp
+
+    def raw_fingerprint_bytes(self) -> bytes:
+        """Row-major cells, one 0/1 byte each (unpacked from the words)."""
+        return self.cells().tobytes()
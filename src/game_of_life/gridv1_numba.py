@@ -0,0 +1,77 @@
+"""
+gridv1_numba.py — Game of Life compiled with Numba
+
+The same cell-by-cell wrap-around loop as gridv1.py, JIT-compiled to
+machine code and parallelised over rows with `prange`.
+
+Requirements:
+    pip install numba
+
+The first `evolve()` pays the compile cost (cached on disk afterwards),
+so the benchmark's warm-up generations keep it out of the timings.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+from grid_fingerprint import fingerprint_cells
+
+
+@njit(cache=True, parallel=True, boundscheck=False, fastmath=True)
+def _evolve(a, out):
+    rows, cols = a.shape
+    for r in prange(rows):
+        # Wrap with compares rather than a modulo per cell
+        rm = r - 1 if r > 0 else rows - 1
+        rp = r + 1 if r < rows - 1 else 0
+        for c in range(cols):
+            cm = c - 1 if c > 0 else cols - 1
+            cp = c + 1 if c < cols - 1 else 0
+            n = (
+                a[rm, cm] + a[rm, c] + a[rm, cp]
+                + a[r, cm] + a[r, cp]
+                + a[rp, cm] + a[rp, c] + a[rp, cp]
+            )
+            out[r, c] = 1 if n == 3 or (n == 2 and a[r, c]) else 0
+
+
+class GridNumba:
+    """
+    Game of Life grid stepped by a Numba-compiled, row-parallel kernel.
+
+    Two uint8 buffers are allocated once and swapped every generation,
+    so `evolve()` allocates nothing.
+    """
+
+    def __init__(self, rows: int, cols: int, data=None):
+        self.rows = rows
+        self.cols = cols
+
+        if data is not None:
+            self.data = np.array(data, dtype=np.uint8).reshape(rows, cols)
+        else:
+            self.data = np.zeros((rows, cols), dtype=np.uint8)
+        self._next = np.empty_like(self.data)
+        self._fp = None
+
+    @classmethod
+    def random(cls, rows: int, cols: int):
+        data = np.random.randint(0, 2, size=(rows, cols), dtype=np.uint8)
+        return cls(rows, cols, data)
+
+    def evolve(self):
+        """Advance one generation in place and return self."""
+        _evolve(self.data, self._next)
+        self.data, self._next = self._next, self.data
+        self._fp = None
+        return self
+
+    def fingerprint(self) -> str:
+        """SHA-256 of the cells, cached until the next evolve()."""
+        if self._fp is None:
+            self._fp = fingerprint_cells(self.data)
+        return self._fp
+
+    def raw_fingerprint_bytes(self) -> bytes:
+        """Row-major cells, one 0/1 byte each."""
+        return self.data.tobytes()
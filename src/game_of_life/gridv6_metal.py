@@ -10,8 +10,15 @@ Requirements:
 Expected performance: 5-10× faster than NumPy for large grids
 """
 
-import hashlib
+import warnings
+
 import torch
+import torch.nn.functional as F
+
+from grid_fingerprint import fingerprint_cells
+
+# Cell value (as a code point) -> display character, for str.translate
+_CELL_CHARS = {0: ' ', 1: '*'}
 
 
 class GridMetal:
@@ -37,53 +44,115 @@ class GridMetal:
         
         if data is not None:
             # Convert input data to GPU tensor
-            if isinstance(data, list):
+            if isinstance(data, torch.Tensor):
+                # Already a tensor (e.g. from random()): no host round-trip
+                cells = data.to(self.device)
+            elif isinstance(data, list):
                 # Python list of lists
-                self.data = torch.tensor(data, dtype=torch.uint8, device=self.device)
+                cells = torch.tensor(data, device=self.device)
             else:
                 # NumPy array or other
-                self.data = torch.tensor(data, dtype=torch.uint8).to(self.device)
+                cells = torch.as_tensor(data).to(self.device)
         else:
             # Create empty grid on GPU
-            self.data = torch.zeros(
-                (rows, cols), dtype=torch.uint8, device=self.device
+            cells = torch.zeros((rows, cols), device=self.device)
+
+        # Cells live as a (1, 1, rows, cols) batch so conv2d can take them
+        # directly; `data` exposes them as a uint8 (rows, cols) tensor on demand.
+        # Counts never exceed 8, so a 16-bit dtype holds them exactly.
+        self._dtype = self._conv_dtype(self.device)
+        self._buf = cells.to(self._dtype).reshape(1, 1, rows, cols)
+
+        self._fp = None
+
+        # Neighbour-count kernel: 3×3 ones with the centre cell excluded
+        self._kernel = torch.tensor(
+            [[[[1, 1, 1], [1, 0, 1], [1, 1, 1]]]],
+            dtype=self._dtype,
+            device=self.device,
+        )
+
+        # Fuse pad + conv + rule into as few Metal kernels as Inductor can;
+        # shapes never change, so specialise on them (dynamic=False).
+        # `compiled` records which path actually runs, for reporting.
+        self.compiled = False
+        self._step_fn = self._compiled_step()
+
+    def _compiled_step(self):
+        """`_next_state` compiled with torch.compile, or eager if that fails here."""
+        try:
+            compiled = torch.compile(GridMetal._next_state, dynamic=False)
+            compiled(self._buf, self._kernel)  # compile now, not in the timed loop
+        except (RuntimeError, NotImplementedError, ImportError) as e:
+            # torch.compile support for MPS varies by PyTorch version; dynamo and
+            # Inductor failures (BackendCompilerFailed, Unsupported) are RuntimeErrors
+            warnings.warn(
+                f"torch.compile failed for GridMetal, running eager instead: {e}",
+                RuntimeWarning,
+                stacklevel=3,
             )
-    
+            return GridMetal._next_state
+        self.compiled = True
+        return compiled
+
+    @staticmethod
+    def _conv_dtype(device: torch.device) -> torch.dtype:
+        """Narrowest dtype the pad + conv2d path supports: int16, else float16."""
+        probe = torch.zeros((1, 1, 3, 3), dtype=torch.int16, device=device)
+        try:
+            F.conv2d(F.pad(probe, (1, 1, 1, 1), mode="circular"), probe)
+            return torch.int16
+        except (RuntimeError, NotImplementedError):
+            return torch.float16
+
+    @property
+    def data(self) -> torch.Tensor:
+        """Current cells as a (rows, cols) uint8 tensor on the GPU."""
+        return self._buf[0, 0].to(torch.uint8)
+
     def evolve(self) -> "GridMetal":
         """
         Evolve the grid by one generation using GPU acceleration.
         
         Uses PyTorch operations that are executed on Metal GPU.
         All computations happen on the GPU - no CPU-GPU transfers
-        until the final result is needed.
+        until the final result is needed. The grid is updated in
+        place and returned, so no new GridMetal is built per step.
         """
-        # Pad with wrap-around (toroidal topology)
-        # This handles the edge cases elegantly
-        padded = torch.nn.functional.pad(
-            self.data.float().unsqueeze(0).unsqueeze(0),
-            (1, 1, 1, 1),
-            mode='circular'
-        ).squeeze()
-        
-        # Count neighbors using convolution
-        # This is where the GPU shines - highly parallel operation
-        neighbors = (
-            padded[:-2, :-2] + padded[:-2, 1:-1] + padded[:-2, 2:]  # row above
-            + padded[1:-1, :-2] + padded[1:-1, 2:]                  # current row (skip center)
-            + padded[2:, :-2] + padded[2:, 1:-1] + padded[2:, 2:]    # row below
-        )
-        
-        # Apply Conway's rules (vectorized on GPU)
-        # Live cell with 2 or 3 neighbors survives
-        # Dead cell with exactly 3 neighbors becomes alive
-        current = self.data.float()
-        alive = (current == 1) & ((neighbors == 2) | (neighbors == 3))
-        born = (current == 0) & (neighbors == 3)
-        
-        next_data = (alive | born).to(torch.uint8)
-        
-        return GridMetal(self.rows, self.cols, next_data)
-    
+        self._step()
+        self._fp = None
+        return self
+
+    def evolve_n(self, n: int) -> "GridMetal":
+        """
+        Evolve the grid by `n` generations in a single call.
+
+        Runs the pad + conv + rule step `n` times back to back on the GPU
+        and synchronises once at the end of the batch, so per-generation
+        Python overhead and dispatch latency are amortised.
+        """
+        for _ in range(n):
+            self._step()
+        torch.mps.synchronize()
+        self._fp = None
+        return self
+
+    def _step(self):
+        """One generation on the GPU, replacing the cell buffer."""
+        self._buf = self._step_fn(self._buf, self._kernel)
+
+    @staticmethod
+    def _next_state(cells: torch.Tensor, kernel: torch.Tensor) -> torch.Tensor:
+        """Next generation of a (1, 1, rows, cols) cell batch (pure, compilable)."""
+        # Pad with wrap-around (toroidal topology), then count neighbours
+        # with a single fused convolution instead of eight slice additions
+        padded = F.pad(cells, (1, 1, 1, 1), mode="circular")
+        neighbors = F.conv2d(padded, kernel)
+
+        # Apply Conway's rules (vectorized on GPU):
+        # born with exactly 3 neighbours, survive with 2 if alive
+        return ((neighbors == 3) | ((neighbors == 2) & (cells == 1))).to(cells.dtype)
+
     def to_cpu(self):
         """Transfer grid data from GPU to CPU."""
         return self.data.cpu().numpy()
@@ -91,20 +160,24 @@ class GridMetal:
     def fingerprint(self) -> str:
         """
         Compute SHA-256 fingerprint for correctness verification.
-        Transfers data to CPU only for fingerprinting.
+        Transfers data to CPU only for fingerprinting (evolve() itself never
+        synchronises), and caches the digest until the next evolve().
         """
-        flat_str = ''.join(str(int(x)) for x in self.data.flatten().cpu().tolist())
-        return hashlib.sha256(flat_str.encode()).hexdigest()
-    
+        if self._fp is None:
+            self._fp = fingerprint_cells(self.to_cpu())
+        return self._fp
+
+    def raw_fingerprint_bytes(self) -> bytes:
+        """Row-major cells, one 0/1 byte each (copied back from the GPU)."""
+        return self.to_cpu().tobytes()
+
     def __str__(self) -> str:
         """String representation of the grid."""
         # Transfer to CPU for display
         cpu_data = self.to_cpu()
-        lines = []
-        for row in cpu_data:
-            line = ''.join('*' if cell else ' ' for cell in row)
-            lines.append(line)
-        return '\n'.join(lines)
+        return '\n'.join(
+            row.tobytes().decode('latin-1').translate(_CELL_CHARS) for row in cpu_data
+        )
     
     @staticmethod
     def random(rows: int, cols: int, seed: int = 42) -> "GridMetal":
@@ -128,25 +201,18 @@ def benchmark_metal(rows: int, cols: int, generations: int, warmup: int = 5):
     
     # Create random grid
     grid = GridMetal.random(rows, cols, seed=42)
+    print(f"Step: {'torch.compile' if grid.compiled else 'eager (torch.compile unavailable)'}")
     
     # Warmup (important for GPU - initializes kernels)
     print("Warming up GPU...", end="", flush=True)
-    for _ in range(warmup):
-        grid = grid.evolve()
-    
-    # Synchronize GPU (make sure warmup is done)
-    torch.mps.synchronize()
+    grid = grid.evolve_n(warmup)  # synchronises at the end of the batch
     print(" done")
     
     # Benchmark
     print("Running benchmark...", end="", flush=True)
     start = time.perf_counter()
     
-    for _ in range(generations):
-        grid = grid.evolve()
-    
-    # Synchronize GPU before timing
-    torch.mps.synchronize()
+    grid = grid.evolve_n(generations)  # synchronises before timing stops
     
     duration = time.perf_counter() - start
     print(f" done")
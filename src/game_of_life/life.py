@@ -1,7 +1,10 @@
 import time
 
+import numpy as np
 import pygame
+import pygame.surfarray
 from gridv1 import Grid
+from gridv1_np import GridListNP
 
 
 def run_display(
@@ -27,6 +30,29 @@ def run_display(
     cell_fill_color = pygame.Color(cell_color)
     background_fill_color = pygame.Color(background_color)
 
+    # Cell value -> RGB, so a frame is one indexed array upload
+    background_rgb = tuple(background_fill_color)[:3]
+    palette = np.array([background_rgb, tuple(cell_fill_color)[:3]], dtype=np.uint8)
+
+    # One pixel per cell, scaled up to the board each frame
+    cells_surface = pygame.Surface((grid.cols, grid.rows))
+    board_size = (grid.cols * cell_width, grid.rows * cell_height)
+    board_surface = pygame.Surface(board_size)
+
+    # Cell borders: background-coloured gaps, transparent elsewhere (built once)
+    x = np.arange(board_size[0]) % cell_width
+    y = np.arange(board_size[1]) % cell_height
+    border_x = (x < border_size) | (x >= cell_width - border_size)
+    border_y = (y < border_size) | (y >= cell_height - border_size)
+    is_border = border_x[:, None] | border_y[None, :]  # surfarray is (x, y)
+    transparent = (255, 0, 255)
+    border_overlay = pygame.Surface(board_size)
+    pygame.surfarray.blit_array(
+        border_overlay,
+        np.where(is_border[..., None], background_rgb, transparent).astype(np.uint8),
+    )
+    border_overlay.set_colorkey(transparent)
+
     clock = pygame.time.Clock()
     running = True
 
@@ -42,18 +68,13 @@ def run_display(
         # Clear screen
         window.fill(background_fill_color)
 
-        # Draw live cells
-        for row in range(grid.rows):
-            for col in range(grid.cols):
-                if grid[row, col]:
-                    x = col * cell_width + border_size
-                    y = row * cell_height + border_size
-                    width = cell_width - 2 * border_size
-                    height = cell_height - 2 * border_size
-
-                    # Avoid drawing zero-size or negative rectangles
-                    if width > 0 and height > 0:
-                        pygame.draw.rect(window, cell_fill_color, (x, y, width, height))
+        # Draw live cells: upload the grid as pixels, scale to cell size,
+        # then mask the borders
+        cells = np.asarray(grid.data, dtype=np.uint8)
+        pygame.surfarray.blit_array(cells_surface, palette[cells].swapaxes(0, 1))
+        pygame.transform.scale(cells_surface, board_size, board_surface)
+        window.blit(board_surface, (0, 0))
+        window.blit(border_overlay, (0, 0))
 
         # Update display
         pygame.display.flip()
@@ -70,7 +91,7 @@ def run_display(
 
 
 def main():
-    start_grid = Grid.random(128, 128)
+    start_grid = GridListNP.random(128, 128)
     run_display(
         start_grid,
         window_height=800,
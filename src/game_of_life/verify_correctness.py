@@ -10,20 +10,38 @@ Usage:
     python verify_correctness.py              # Verify all implementations
     python verify_correctness.py --verbose    # Show full fingerprints
     python verify_correctness.py --save-grids # Save final grids to files
+    python verify_correctness.py --strict     # Hash with SHA-256 instead of xxh3
 """
 
 import argparse
 import csv
 import hashlib
-import random
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 # Import all Python grid implementations
 from gridv1 import Grid as PyGrid
-from gridv1_np import GridNP
+from gridv1_np import GridListNP, GridNP
+from gridv1_np_bits import GridNPBits
+
+try:
+    from gridv1_numba import GridNumba
+except ImportError:
+    GridNumba = None
+
+try:
+    from gridv1_cython import GridCython
+except ImportError:
+    GridCython = None
 
 # Configuration
 ROWS = 64
@@ -32,20 +50,52 @@ GENERATIONS = 100
 SEED = 42
 
 
+@lru_cache(maxsize=None)
+def _seeded_grid(rows, cols):
+    """One seeded draw per shape, frozen so callers must copy to mutate."""
+    rng = np.random.default_rng(SEED)
+    grid = rng.integers(0, 2, size=(rows, cols), dtype=np.uint8)
+    grid.setflags(write=False)
+    return grid
+
+
 def generate_test_grid():
-    """Generate deterministic test grid."""
-    random.seed(SEED)
-    np.random.seed(SEED)
-    return [[random.randint(0, 1) for _ in range(COLS)] for _ in range(ROWS)]
+    """Generate deterministic test grid as a read-only ROWS×COLS uint8 array."""
+    return _seeded_grid(ROWS, COLS)
 
 
 def grid_to_string(grid_data):
     """Convert 2D grid data to flat string."""
-    result = ""
-    for row in grid_data:
-        for cell in row:
-            result += "1" if cell == 1 else "0"
-    return result
+    arr = np.asarray(grid_data, dtype=np.uint8)
+    return (arr + ord("0")).tobytes().decode("ascii")
+
+
+def hash_cells(buf, strict=False):
+    """
+    Checksum of raw cell bytes, returned as (algorithm, hex digest).
+
+    Only implementations are compared, so a fast non-cryptographic hash is
+    enough: xxh3-128 when `xxhash` is installed, else 128-bit BLAKE2b.
+    `strict` uses SHA-256 for reproducible, documentable digests.
+    """
+    if strict:
+        return "SHA256", hashlib.sha256(buf).hexdigest()
+    if xxhash is not None:
+        return "XXH3-128", xxhash.xxh3_128(buf).hexdigest()
+    return "BLAKE2b-128", hashlib.blake2b(buf, digest_size=16).hexdigest()
+
+
+_RAW_TO_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def raw_to_string(buf):
+    """Convert raw 0/1 cell bytes to a flat '0'/'1' string (for display)."""
+    return buf.translate(_RAW_TO_ASCII).decode("ascii")
+
+
+def raw_to_grid(buf):
+    """Convert raw 0/1 cell bytes back to a ROWS×COLS list of lists."""
+    return np.frombuffer(buf, dtype=np.uint8).reshape(ROWS, COLS).tolist()
 
 
 def save_grid_to_file(grid_data, filename):
@@ -57,19 +107,26 @@ def save_grid_to_file(grid_data, filename):
 
 
 class VerificationRunner:
-    def __init__(self, verbose=False, save_grids=False):
+    def __init__(self, verbose=False, save_grids=False, strict=False):
         self.verbose = verbose
         self.save_grids = save_grids
+        self.strict = strict
+        self.hash_name = None
         self.fingerprints = {}
         self.raw_fingerprints = {}
         
     def verify_python(self, name, GridCls, initial_data):
-        """Run and verify a Python implementation."""
+        """Run and verify a Python implementation.
+
+        `initial_data` is a uint8 ndarray for array-backed grids (built as
+        `GridCls(array)`) or a list of lists for `GridCls(rows, cols, data)`.
+        """
         print(f"Testing {name}...", end="", flush=True)
         
         try:
-            if "NumPy" in name:
-                grid = GridCls(np.array(initial_data, dtype=np.uint8))
+            if isinstance(initial_data, np.ndarray):
+                # Copy: double-buffered grids reuse their input as scratch
+                grid = GridCls(initial_data.copy())
             else:
                 grid = GridCls(ROWS, COLS, initial_data)
             
@@ -77,29 +134,25 @@ class VerificationRunner:
             for _ in range(GENERATIONS):
                 grid = grid.evolve()
             
-            # Get fingerprint
-            fp = grid.fingerprint()
-            fp_hash = hashlib.sha256(fp.encode()).hexdigest()
+            # Get fingerprint (row-major 0/1 cell bytes, hashed as-is)
+            buf = grid.raw_fingerprint_bytes()
+            self.hash_name, fp_hash = hash_cells(buf, self.strict)
             
             self.fingerprints[name] = fp_hash
-            self.raw_fingerprints[name] = fp
+            self.raw_fingerprints[name] = buf
             
             if self.verbose:
+                fp = raw_to_string(buf)
                 print(f"\n   Fingerprint: {fp[:64]}... (length: {len(fp)})")
-                print(f"   SHA256: {fp_hash}")
+                print(f"   {self.hash_name}: {fp_hash}")
             else:
                 print(" ✓")
             
             if self.save_grids:
                 # Convert back to 2D for saving
-                grid_2d = []
-                for r in range(ROWS):
-                    row = []
-                    for c in range(COLS):
-                        idx = r * COLS + c
-                        row.append(int(fp[idx]))
-                    grid_2d.append(row)
-                save_grid_to_file(grid_2d, f"verify_{name.lower().replace(' ', '_')}.csv")
+                grid_2d = raw_to_grid(buf)
+                slug = re.sub(r"\W+", "_", name.lower())
+                save_grid_to_file(grid_2d, f"verify_{slug}.csv")
             
             return True
             
@@ -123,20 +176,20 @@ class VerificationRunner:
         ref_raw = self.raw_fingerprints[ref_name]
         
         print(f"\nReference: {ref_name}")
-        print(f"  SHA256: {ref_fp}")
+        print(f"  {self.hash_name}: {ref_fp}")
         
         if self.verbose:
-            print(f"  Raw fingerprint (first 64 chars): {ref_raw[:64]}...")
+            print(f"  Raw fingerprint (first 64 chars): {raw_to_string(ref_raw[:64])}...")
             print(f"  Length: {len(ref_raw)} characters")
         
         print("\nComparison:")
         all_match = True
         
-        for name, fp in self.fingerprints.items():
+        for name, raw in self.raw_fingerprints.items():
             if name == ref_name:
                 continue
             
-            if fp == ref_fp:
+            if raw == ref_raw:
                 print(f"  ✓ {name:<20} matches reference")
             else:
                 print(f"  ✗ {name:<20} MISMATCH!")
@@ -144,20 +197,16 @@ class VerificationRunner:
                 
                 if self.verbose:
                     # Find first difference
-                    raw_ref = ref_raw
-                    raw_test = self.raw_fingerprints[name]
-                    
-                    if len(raw_ref) != len(raw_test):
-                        print(f"    Length mismatch: {len(raw_test)} vs {len(raw_ref)}")
+                    if len(raw) != len(ref_raw):
+                        print(f"    Length mismatch: {len(raw)} vs {len(ref_raw)}")
                     else:
-                        for i, (c1, c2) in enumerate(zip(raw_ref, raw_test)):
-                            if c1 != c2:
-                                row = i // COLS
-                                col = i % COLS
-                                print(f"    First difference at position {i} (row {row}, col {col})")
-                                print(f"    Reference: '{c1}', Test: '{c2}'")
-                                print(f"    Context: ...{raw_ref[max(0,i-5):i+6]}...")
-                                break
+                        ref_cells = np.frombuffer(ref_raw, dtype=np.uint8)
+                        test_cells = np.frombuffer(raw, dtype=np.uint8)
+                        i = int(np.flatnonzero(ref_cells != test_cells)[0])
+                        row, col = divmod(i, COLS)
+                        print(f"    First difference at position {i} (row {row}, col {col})")
+                        print(f"    Reference: '{ref_raw[i]}', Test: '{raw[i]}'")
+                        print(f"    Context: ...{raw_to_string(ref_raw[max(0, i - 5):i + 6])}...")
         
         print("\n" + "=" * 70)
         
@@ -177,12 +226,19 @@ class VerificationRunner:
         print(f"Generations: {GENERATIONS}")
         print(f"Seed: {SEED}\n")
         
-        # Generate initial grid
-        initial_data = generate_test_grid()
+        # Generate initial grid (ndarray); list-based grids share one .tolist()
+        initial_arr = generate_test_grid()
+        initial_list = initial_arr.tolist()
         
         # Test Python implementations
-        self.verify_python("Pure Python", PyGrid, initial_data)
-        self.verify_python("NumPy", GridNP, initial_data)
+        self.verify_python("Pure Python", PyGrid, initial_list)
+        self.verify_python("NumPy", GridNP, initial_arr)
+        self.verify_python("List API, vectorised", GridListNP, initial_list)
+        self.verify_python("NumPy bit-packed", GridNPBits, initial_arr)
+        if GridNumba is not None:
+            self.verify_python("Numba", GridNumba, initial_list)
+        if GridCython is not None:
+            self.verify_python("Cython", GridCython, initial_list)
         
         # Compare results
         return self.compare_all()
@@ -203,6 +259,11 @@ def main():
         action="store_true",
         help="Save final grids to CSV files for manual inspection"
     )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fingerprint with SHA-256 rather than the faster xxh3/BLAKE2b"
+    )
     parser.add_argument(
         "--rows",
         type=int,
@@ -231,7 +292,9 @@ def main():
     GENERATIONS = args.generations
     
     # Run verification
-    runner = VerificationRunner(verbose=args.verbose, save_grids=args.save_grids)
+    runner = VerificationRunner(
+        verbose=args.verbose, save_grids=args.save_grids, strict=args.strict
+    )
     success = runner.run()
     
     sys.exit(0 if success else 1)
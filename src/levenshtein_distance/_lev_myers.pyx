@@ -0,0 +1,79 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Bit-parallel (Myers/Hyyrö) Levenshtein distance as a C extension.
+
+Build in place with:
+
+    python build_lev_myers.py
+
+The shorter string is the pattern, split into 64-bit words. Each
+character of the other string advances a whole DP column with a handful
+of word-wide AND/OR/ADD/XOR operations (64 cells per register), passing
+the horizontal carries from word to word, so any length is supported.
+"""
+
+from libc.stdint cimport uint64_t
+from libc.stdlib cimport calloc, free, malloc
+
+
+def distance(str s1, str s2):
+    """Levenshtein distance between two Latin-1 strings."""
+    cdef bytes text_b = s1.encode("latin-1")
+    cdef bytes pat_b = s2.encode("latin-1")
+    if len(text_b) < len(pat_b):
+        text_b, pat_b = pat_b, text_b
+
+    cdef const unsigned char* text = text_b
+    cdef const unsigned char* pat = pat_b
+    cdef Py_ssize_t n = len(text_b)
+    cdef Py_ssize_t m = len(pat_b)
+    if m == 0:
+        return n
+
+    cdef Py_ssize_t words = (m + 63) // 64
+    cdef uint64_t* peq = <uint64_t*>calloc(256 * words, sizeof(uint64_t))
+    cdef uint64_t* vp = <uint64_t*>malloc(words * sizeof(uint64_t))
+    cdef uint64_t* vn = <uint64_t*>calloc(words, sizeof(uint64_t))
+    if not peq or not vp or not vn:
+        free(peq); free(vp); free(vn)
+        raise MemoryError()
+
+    cdef uint64_t one = 1
+    cdef uint64_t last = one << ((m - 1) % 64)
+    cdef uint64_t x, d0, hp, hn, hp_carry, hn_carry, hp_in, hn_in
+    cdef const uint64_t* eq
+    cdef Py_ssize_t i, w
+    cdef Py_ssize_t score = m
+
+    with nogil:
+        # Match masks: bit i of peq[c][i // 64] is set where pat[i] == c
+        for i in range(m):
+            peq[pat[i] * words + i // 64] |= one << (i % 64)
+        for w in range(words):
+            vp[w] = ~(<uint64_t>0)
+
+        for i in range(n):
+            eq = peq + text[i] * words
+            hp_carry = 1  # row 0 of the DP grows by one per text character
+            hn_carry = 0
+            for w in range(words):
+                x = eq[w] | hn_carry
+                d0 = (((x & vp[w]) + vp[w]) ^ vp[w]) | x | vn[w]
+                hp = vn[w] | ~(d0 | vp[w])
+                hn = d0 & vp[w]
+                hp_in = hp_carry
+                hn_in = hn_carry
+                if w < words - 1:
+                    hp_carry = hp >> 63
+                    hn_carry = hn >> 63
+                else:
+                    hp_carry = (hp & last) != 0
+                    hn_carry = (hn & last) != 0
+                hp = (hp << 1) | hp_in
+                hn = (hn << 1) | hn_in
+                vp[w] = hn | ~(d0 | hp)
+                vn[w] = hp & d0
+            score += <Py_ssize_t>hp_carry - <Py_ssize_t>hn_carry
+
+    free(peq); free(vp); free(vn)
+    return score
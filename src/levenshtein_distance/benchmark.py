@@ -1,48 +1,56 @@
-import time
+import gc
 import sys
+from timeit import Timer
 import pandas as pd  # For nice table output
 
-# Note: Install deps for: duckdb rapidfuzz python-Levenshtein polyleven textdistance
-# For Mojo: Run `mojo build levenshtein_mojo.mojo` first, then import levenshtein_mojo
-# Run this script: python benchmark_all.py
-
-
-# 1. Pure Python (from the post)
-def levenshtein_python(s1, s2):
-    """Pure Python Levenshtein Distance - O(m*n) space."""
-    m, n = len(s1), len(s2)
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
-    # Initialize boundaries
-    for i in range(m + 1):
-        dp[i][0] = i
-    for j in range(n + 1):
-        dp[0][j] = j
-    # Fill DP table
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            cost = 0 if s1[i - 1] == s2[j - 1] else 1
-            dp[i][j] = min(
-                dp[i - 1][j] + 1,  # deletion
-                dp[i][j - 1] + 1,  # insertion
-                dp[i - 1][j - 1] + cost,  # substitution
-            )
-    return dp[m][n]
+# Note: Install deps for: duckdb rapidfuzz python-Levenshtein polyleven textdistance (numba optional)
+# For the C extension row: pip install cython, then python build_lev_myers.py
+# For Mojo: install the `mojo` package; `mojo.importer` builds ld_list.mojo on import
+# Run this script: python benchmark.py
+
+
+# 1. Pure Python (from the post), plus the Numba and Cython kernels (8, 9),
+# live in ld_kernels so tests can import them without running the benchmark
+from ld_kernels import (
+    levenshtein_banded,
+    levenshtein_blocked,
+    levenshtein_myers,
+    levenshtein_numba,
+    levenshtein_python,
+    levenshtein_simd_myers,
+)
 
 
 # 2. DuckDB (requires pip install duckdb)
 import duckdb
 
 
+# One connection for the whole run, so timings measure levenshtein()
+# rather than duckdb.connect(); strings are bound as query parameters
+_DUCK = duckdb.connect(":memory:")
+_DUCK_SQL = "SELECT levenshtein(?, ?)"
+
+
 def levenshtein_duckdb(s1, s2):
     """DuckDB native Levenshtein."""
-    # Use a temp connection for single query
-    con = duckdb.connect(":memory:")
-    result = con.execute(f"SELECT levenshtein('{s1}', '{s2}')").fetchone()[0]
-    con.close()
-    return result
+    return _DUCK.execute(_DUCK_SQL, [s1, s2]).fetchone()[0]
+
+
+def register_duckdb_pairs(a, b):
+    """Register columns of pairs as the `pairs` view (done once, outside timing)."""
+    _DUCK.register("pairs", pd.DataFrame({"a": a, "b": b}))
+
+
+def levenshtein_duckdb_batch(a, b):
+    """DuckDB Levenshtein over the registered `pairs` view in one vectorised query.
+
+    `a` and `b` must already be registered with `register_duckdb_pairs`.
+    """
+    return [d for (d,) in _DUCK.execute("SELECT levenshtein(a, b) FROM pairs").fetchall()]
 
 
 # 3. rapidfuzz (pip install rapidfuzz)
+from rapidfuzz import process
 from rapidfuzz.distance import Levenshtein
 
 
@@ -51,6 +59,11 @@ def levenshtein_rapidfuzz(s1, s2):
     return Levenshtein.distance(s1, s2)
 
 
+def levenshtein_rapidfuzz_batch(a, b):
+    """RapidFuzz pairwise distances (a[i] vs b[i]) in one native call."""
+    return process.cpdist(a, b, scorer=Levenshtein.distance).tolist()
+
+
 # 4. python-Levenshtein (pip install python-Levenshtein)
 from Levenshtein import distance as levenshtein_c
 
@@ -72,37 +85,47 @@ def levenshtein_polyleven(s1, s2):
 # 6. textdistance (pip install textdistance) - pure Python fallback
 import textdistance
 
+# Built once; external=False stops it handing off to rapidfuzz /
+# python-Levenshtein, so this row really is the pure-Python library
+_TD_LEV = textdistance.Levenshtein(external=False)
+
 
 def levenshtein_textdistance(s1, s2):
     """Textdistance Levenshtein (pure Python)."""
-    return textdistance.levenshtein(s1, s2)
+    return _TD_LEV.distance(s1, s2)
 
 
-# 7. Mojo (after building)
+# 7. Mojo (built from ld_list.mojo on import, as in ld_list_test.py)
 try:
-    import ld_list
+    import mojo.importer  # noqa: F401 - compiles .mojo modules on import
+    from ld_list import distance as _lev_mojo  # bound once, no per-call lookup
 
     def levenshtein_mojo(s1, s2):
         """Mojo compiled version."""
-        return ld_list.distance(s1, s2)
+        return _lev_mojo(s1, s2)
 except ImportError:
-    print("Warning: Mojo not available (run 'mojo build ld_list.mojo'). Skipping.")
+    print("Warning: Mojo not available (pip install mojo to build ld_list.mojo). Skipping.")
+    _lev_mojo = None
 
     def levenshtein_mojo(s1, s2):
         raise NotImplementedError("Mojo module not built.")
 
 
 # Benchmark function
-def bench(name: str, func, s1, s2, repeats: int = 20):
-    """Time the function over repeats, return min time."""
-    times = []
-    # Warmup
-    func(s1, s2)
-    for _ in range(repeats):
-        t0 = time.perf_counter()
-        func(s1, s2)
-        times.append(time.perf_counter() - t0)
-    return min(times)
+def bench(name: str, func, s1, s2, repeats: int = 5):
+    """Best per-call time over repeats, each looping enough to beat clock resolution."""
+    timer = Timer(lambda: func(s1, s2))
+    # Timer.timeit() pauses GC per sample; keep it off across the whole
+    # measurement too, starting from a clean heap
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        loops, _ = timer.autorange()  # also serves as the warmup
+        return min(timer.repeat(repeat=repeats, number=loops)) / loops
+    finally:
+        if gc_was_enabled:
+            gc.enable()
 
 
 # Generate comprehensive test cases: vary lengths and similarity
@@ -117,6 +140,11 @@ def generate_test_cases():
     ]
 
 
+# Longest input an impl is timed on. Pure-Python textdistance (external=False)
+# takes over a second per call on the 1000-char case and adds nothing beyond
+# the Python baseline there (which is kept: every speedup column is relative to it).
+MAX_LEN = {"Textdistance": 500}
+
 # Run benchmarks
 test_cases = generate_test_cases()
 results = []
@@ -135,12 +163,20 @@ for s1, s2 in test_cases:
         ("Polyleven", levenshtein_polyleven),
         ("Textdistance", levenshtein_textdistance),
         ("Mojo", levenshtein_mojo),
+        ("Numba", levenshtein_numba),
+        ("Myers64", levenshtein_myers),
+        ("Banded", levenshtein_banded),
+        ("Blocked", levenshtein_blocked),
+        ("SIMD-Myers", levenshtein_simd_myers),
     ]
 
     for name, func in impls:
+        if max(len(s1), len(s2)) > MAX_LEN.get(name, float("inf")):
+            row[name + "_s"] = "Skipped"
+            continue
         try:
             t = bench(name, func, s1, s2)
-            row[name + "_s"] = f"{t:.6f}"
+            row[name + "_s"] = f"{t:.9f}"
             if name == baseline_name:
                 baseline_time = t
             if baseline_time:
@@ -151,6 +187,28 @@ for s1, s2 in test_cases:
 
     results.append(row)
 
+# Batched: all test cases in one call, so DuckDB's vectorised engine and
+# rapidfuzz cross the Python/native boundary once rather than per pair
+batch_a = [s1 for s1, _ in test_cases]
+batch_b = [s2 for _, s2 in test_cases]
+batch_impls = [
+    ("DuckDB batch", levenshtein_duckdb_batch),
+    ("RapidFuzz cpdist", levenshtein_rapidfuzz_batch),
+]
+batch_results = []
+register_duckdb_pairs(batch_a, batch_b)  # outside bench(): time only the query
+
+for name, func in batch_impls:
+    row = {"impl": name, "pairs": len(test_cases)}
+    try:
+        t = bench(name, func, batch_a, batch_b)
+        row["total_s"] = f"{t:.9f}"
+        row["per_pair_s"] = f"{t / len(test_cases):.9f}"
+    except Exception as e:
+        row["total_s"] = "Error"
+        row["per_pair_s"] = str(e)
+    batch_results.append(row)
+
 # Output as DataFrame table (print and save to CSV)
 df = pd.DataFrame(results)
 print("\nComprehensive Levenshtein Distance Benchmarks")
@@ -162,6 +220,9 @@ print(
     "\nResults saved to ld_benchmarks.csv. Columns: len1, len2, case, [Impl]_s, [Impl]_speedup"
 )
 
+print("\nBatched Levenshtein (all cases in one call)")
+print(pd.DataFrame(batch_results).to_string(index=False))
+
 # Optional: Verify correctness on first case (all should return 4 for "hello" vs "world")
 print("\nVerification (expected: 4 for 'hello' vs 'world'):")
 for name, func in impls:
@@ -170,3 +231,10 @@ for name, func in impls:
         print(f"{name}: {res}")
     except:
         print(f"{name}: Error")
+register_duckdb_pairs(["hello"], ["world"])
+for name, func in batch_impls:
+    try:
+        res = func(["hello"], ["world"])[0]
+        print(f"{name}: {res}")
+    except:
+        print(f"{name}: Error")
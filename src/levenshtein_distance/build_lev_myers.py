@@ -0,0 +1,32 @@
+"""
+Build the optional Cython Levenshtein kernel (`_lev_myers.pyx`) in place.
+
+Run with:
+
+    python build_lev_myers.py
+
+Requires `cython` and a C compiler. Once built, `benchmark.py` times it
+as the "SIMD-Myers" row.
+"""
+
+import os
+from pathlib import Path
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+HERE = Path(__file__).parent.resolve()
+
+extension = Extension(
+    "_lev_myers",
+    ["_lev_myers.pyx"],
+    extra_compile_args=["-O3", "-march=native"],
+)
+
+if __name__ == "__main__":
+    os.chdir(HERE)  # build_ext --inplace writes next to the current directory
+    setup(
+        name="levenshtein-myers",
+        ext_modules=cythonize([extension]),
+        script_args=["build_ext", "--inplace"],
+    )
@@ -0,0 +1,219 @@
+"""
+Levenshtein kernels written in this repo, importable without running the benchmark.
+
+`benchmark.py` times these alongside the third-party libraries, and
+`tests/test_kernels_parity.py` checks them against a reference DP. The
+Numba and Cython kernels are optional: when their dependency is missing
+(or `_lev_myers` has not been built) the function raises NotImplementedError.
+"""
+
+import numpy as np
+
+
+# 1. Pure Python (from the post)
+def levenshtein_python(s1, s2, cutoff=None):
+    """Pure Python Levenshtein Distance - two rolling rows, O(min(m,n)) space.
+
+    With `cutoff`, stops once every cell of a row exceeds it and returns
+    cutoff + 1, since row minima never decrease.
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    m, n = len(s1), len(s2)
+    prev = list(range(n + 1))
+    curr = [0] * (n + 1)
+    for i in range(1, m + 1):
+        curr[0] = i
+        c1 = s1[i - 1]
+        for j in range(1, n + 1):
+            cost = 0 if c1 == s2[j - 1] else 1
+            curr[j] = min(
+                prev[j] + 1,  # deletion
+                curr[j - 1] + 1,  # insertion
+                prev[j - 1] + cost,  # substitution
+            )
+        if cutoff is not None and min(curr) > cutoff:
+            return cutoff + 1
+        prev, curr = curr, prev
+    if cutoff is not None and prev[n] > cutoff:
+        return cutoff + 1
+    return prev[n]
+
+
+# 8. Numba (pip install numba) - the two-row DP compiled to native code
+def _codepoints(s):
+    """String as a uint32 array of code points (what the JIT kernels consume)."""
+    return np.frombuffer(s.encode("utf-32-le"), dtype=np.uint32)
+
+
+try:
+    from numba import njit, types
+    from numba.typed import Dict
+
+    @njit(cache=True)
+    def _lev_nb(a, b):
+        if a.shape[0] < b.shape[0]:
+            a, b = b, a
+        m, n = a.shape[0], b.shape[0]
+        prev = np.arange(n + 1)
+        curr = np.empty(n + 1, dtype=prev.dtype)
+        for i in range(1, m + 1):
+            curr[0] = i
+            c1 = a[i - 1]
+            for j in range(1, n + 1):
+                sub = prev[j - 1] + (c1 != b[j - 1])
+                ins = curr[j - 1] + 1
+                dele = prev[j] + 1
+                curr[j] = min(sub, ins, dele)
+            prev, curr = curr, prev
+        return prev[n]
+
+    @njit(cache=True)
+    def _lev_myers64(a, b):
+        if a.shape[0] < b.shape[0]:
+            a, b = b, a
+        m = b.shape[0]  # shorter string is the pattern, one bit per character
+        if m == 0:
+            return a.shape[0]
+        one = np.uint64(1)
+        # Match masks per character: a flat table for Latin-1 patterns,
+        # a hash map only when the pattern needs wider code points
+        wide = b.max() > 255
+        table = np.zeros(256, dtype=np.uint64)
+        peq = Dict.empty(key_type=types.uint32, value_type=types.uint64)
+        for i in range(m):
+            if wide:
+                peq[b[i]] = peq.get(b[i], np.uint64(0)) | (one << np.uint64(i))
+            else:
+                table[b[i]] |= one << np.uint64(i)
+        vp = ~np.uint64(0)
+        vn = np.uint64(0)
+        last = one << np.uint64(m - 1)
+        score = m
+        for c in a:
+            if wide:
+                eq = peq.get(c, np.uint64(0))
+            else:
+                eq = table[c] if c < 256 else np.uint64(0)
+            x = eq | vn
+            d0 = (((x & vp) + vp) ^ vp) | x
+            hp = vn | ~(d0 | vp)
+            hn = vp & d0
+            if hp & last:
+                score += 1
+            elif hn & last:
+                score -= 1
+            hp = (hp << one) | one
+            hn = hn << one
+            vp = hn | ~(d0 | hp)
+            vn = hp & d0
+        return score
+
+    @njit(cache=True)
+    def _lev_banded(a, b, k):
+        m, n = a.shape[0], b.shape[0]
+        big = k + 1  # anything outside the band is "more than k"
+        if abs(m - n) > k:
+            return big
+        prev = np.minimum(np.arange(n + 1), big)
+        curr = np.empty(n + 1, dtype=prev.dtype)
+        for i in range(1, m + 1):
+            lo = max(1, i - k)
+            hi = min(n, i + k)
+            curr[lo - 1] = i if lo == 1 else big
+            c1 = a[i - 1]
+            left = curr[lo - 1]
+            for j in range(lo, hi + 1):
+                sub = prev[j - 1] + (c1 != b[j - 1])
+                ins = left + 1
+                dele = prev[j] + 1
+                left = min(sub, ins, dele)
+                curr[j] = left
+            if hi < n:
+                curr[hi + 1] = big  # next row's band reaches one column further
+            prev, curr = curr, prev
+        # Paths leaving the band only over-count, so clamp once at the end
+        return min(prev[n], big)
+
+    @njit(cache=True)
+    def _lev_blocked(a, b, block):
+        m, n = a.shape[0], b.shape[0]
+        top = np.arange(n + 1)  # DP row along the top of the current strip
+        left = np.empty(block + 1, dtype=top.dtype)  # column left of the block
+        for i0 in range(0, m, block):
+            h = min(block, m - i0)
+            for r in range(h + 1):
+                left[r] = i0 + r
+            for j0 in range(0, n, block):
+                j1 = min(j0 + block, n)
+                # Sweep the h x (j1 - j0) tile row by row; `top[j0+1:j1+1]`
+                # and `left` stay in L1 and become the tile's bottom/right edges
+                prev_left = left[0]
+                left[0] = top[j1]
+                for r in range(1, h + 1):
+                    c1 = a[i0 + r - 1]
+                    diag = prev_left
+                    cur = left[r]
+                    prev_left = cur
+                    for j in range(j0 + 1, j1 + 1):
+                        up = top[j]
+                        cur = min(diag + (c1 != b[j - 1]), up + 1, cur + 1)
+                        diag = up
+                        top[j] = cur
+                    left[r] = cur
+            top[0] = i0 + h
+        return top[n]
+
+    def levenshtein_numba(s1, s2):
+        """Numba-compiled two-row DP."""
+        return _lev_nb(_codepoints(s1), _codepoints(s2))
+
+    def levenshtein_myers(s1, s2):
+        """Bit-parallel Myers/Hyyrö: a whole DP column per 64-bit word."""
+        if min(len(s1), len(s2)) > 64:
+            raise ValueError("Myers64 needs one string of at most 64 characters")
+        return _lev_myers64(_codepoints(s1), _codepoints(s2))
+
+    def levenshtein_banded(s1, s2, threshold=None):
+        """Ukkonen band: only cells within `threshold` of the diagonal.
+
+        Returns threshold + 1 when the distance exceeds `threshold`; the
+        default, max(len(s1), len(s2)), is exact so results match the others.
+        """
+        if threshold is None:
+            threshold = max(len(s1), len(s2))
+        return _lev_banded(_codepoints(s1), _codepoints(s2), threshold)
+
+    def levenshtein_blocked(s1, s2, block=64):
+        """Full DP computed in block x block tiles that stay cache-resident."""
+        return _lev_blocked(_codepoints(s1), _codepoints(s2), block)
+
+    # compile now, not inside bench()
+    levenshtein_numba("kitten", "sitting")
+    levenshtein_myers("kitten", "sitting")
+    levenshtein_banded("kitten", "sitting")
+    levenshtein_blocked("kitten", "sitting")
+except ImportError:
+    print("Warning: Numba not available (pip install numba). Skipping.")
+
+    def levenshtein_numba(s1, s2):
+        raise NotImplementedError("Numba not installed.")
+
+    def levenshtein_myers(s1, s2):
+        raise NotImplementedError("Numba not installed.")
+
+    def levenshtein_banded(s1, s2, threshold=None):
+        raise NotImplementedError("Numba not installed.")
+
+    def levenshtein_blocked(s1, s2, block=64):
+        raise NotImplementedError("Numba not installed.")
+
+
+# 9. Cython C extension (python build_lev_myers.py) - multi-word bit-parallel Myers
+try:
+    from _lev_myers import distance as levenshtein_simd_myers
+except ImportError:
+    print("Warning: _lev_myers not built (run 'python build_lev_myers.py'). Skipping.")
+
+    def levenshtein_simd_myers(s1, s2):
+        raise NotImplementedError("_lev_myers extension not built.")
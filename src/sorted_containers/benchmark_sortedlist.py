@@ -1,8 +1,10 @@
 """Quick-and-dirty benchmark comparing `sortedcontainers.SortedList`
 against the Mojo-backed `mojo_sortedlist.SortedList`.
 
-This is intentionally simple and focuses on bulk `add` of random
-integers so we can get an initial feel for relative performance.
+This is intentionally simple and focuses on building from random
+integers, both by repeated `add` and by the bulk constructor
+(`SortedList(values)`), so we can get an initial feel for relative
+performance.
 
 Run with:
 
@@ -28,19 +30,40 @@ if str(MOJO_SORTEDLIST_DIR) not in sys.path:
 import mojo_sortedlist  # type: ignore[import-not-found]
 
 
-def bench_build(label: str, cls, values: list[int]) -> float:
-    """Time building a sorted list by repeated ``add`` calls."""
+def bench_build(label: str, cls, values: list[int], runs: int = 1) -> int:
+    """Time building a sorted list by repeated ``add`` calls.
 
-    t0 = time.perf_counter()
-    s = cls()
-    for v in values:
-        s.add(v)
-    t1 = time.perf_counter()
+    Uses integer nanoseconds (``perf_counter_ns``) so short runs never
+    round to zero, and reports the best of ``runs`` builds.
+    """
 
-    elapsed = t1 - t0
-    ops_per_sec = len(values) / elapsed if elapsed > 0 else float("inf")
-    print(f"{label:30s}: {elapsed:8.3f}s  ({ops_per_sec:12.0f} ops/s)")
-    return elapsed
+    timings = []
+    for _ in range(runs):
+        t0 = time.perf_counter_ns()
+        s = cls()
+        for v in values:
+            s.add(v)
+        timings.append(time.perf_counter_ns() - t0)
+
+    elapsed_ns = min(timings)
+    ops_per_sec = len(values) * 1e9 / elapsed_ns if elapsed_ns else float("inf")
+    print(f"{label:30s}: {elapsed_ns:15,d} ns  ({ops_per_sec:12.0f} ops/s)")
+    return elapsed_ns
+
+
+def bench_build_bulk(label: str, cls, values: list[int], runs: int = 1) -> int:
+    """Time building a sorted list in one ``cls(values)`` call (sort once)."""
+
+    timings = []
+    for _ in range(runs):
+        t0 = time.perf_counter_ns()
+        cls(values)
+        timings.append(time.perf_counter_ns() - t0)
+
+    elapsed_ns = min(timings)
+    ops_per_sec = len(values) * 1e9 / elapsed_ns if elapsed_ns else float("inf")
+    print(f"{label:30s}: {elapsed_ns:15,d} ns  ({ops_per_sec:12.0f} ops/s)")
+    return elapsed_ns
 
 
 def main() -> None:
@@ -48,7 +71,7 @@ def main() -> None:
     n = 100_000
     seed = 42
 
-    print(f"Benchmarking bulk add of {n:,} random integers (seed={seed})")
+    print(f"Benchmarking building from {n:,} random integers (seed={seed})")
 
     random.seed(seed)
     values = [random.randint(0, 1_000_000) for _ in range(n)]
@@ -57,17 +80,28 @@ def main() -> None:
     warm_values = values[:1_000]
     bench_build("python SortedList (warmup)", PySortedList, warm_values)
     bench_build("mojo   SortedList (warmup)", mojo_sortedlist.SortedList, warm_values)
+    bench_build_bulk("python bulk build (warmup)", PySortedList, warm_values)
+    bench_build_bulk("mojo   bulk build (warmup)", mojo_sortedlist.SortedList, warm_values)
     print()
 
-    # Real benchmark.
-    t_py = bench_build("python SortedList", PySortedList, values)
-    t_mojo = bench_build("mojo   SortedList", mojo_sortedlist.SortedList, values)
+    # Real benchmark (best of 5).
+    t_py = bench_build("python SortedList", PySortedList, values, runs=5)
+    t_mojo = bench_build("mojo   SortedList", mojo_sortedlist.SortedList, values, runs=5)
+
+    t_py_bulk = bench_build_bulk("python bulk build", PySortedList, values, runs=5)
+    t_mojo_bulk = bench_build_bulk(
+        "mojo   bulk build", mojo_sortedlist.SortedList, values, runs=5
+    )
 
     print()
-    if t_mojo > 0:
-        print(f"Speedup (python / mojo): {t_py / t_mojo:0.2f}x")
-    else:
-        print("Mojo time is ~0; speedup is effectively infinite for this run.")
+    for scenario, py_ns, mojo_ns in (
+        ("add", t_py, t_mojo),
+        ("bulk", t_py_bulk, t_mojo_bulk),
+    ):
+        if mojo_ns > 0:
+            print(f"Speedup {scenario:4s} (python / mojo): {py_ns / mojo_ns:0.2f}x")
+        else:
+            print(f"Mojo {scenario} time is ~0; speedup is effectively infinite for this run.")
 
 
 if __name__ == "__main__":  # pragma: no cover - manual benchmark
@@ -0,0 +1,95 @@
+"""Parity tests for the Python Game of Life grids.
+
+Every implementation evolves the same seeded grid and must end up with
+byte-identical cells (`raw_fingerprint_bytes()`) and the same shared
+fingerprint as the pure-Python `gridv1.Grid` reference. Optional
+implementations (Numba, the `_gridc` Cython extension) are skipped when
+they are not installed or built.
+"""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Quick path tweak so `src/game_of_life` is importable without installing
+# the package (the grid modules import each other by bare name).
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+GAME_OF_LIFE_DIR = PROJECT_ROOT / "src" / "game_of_life"
+if str(GAME_OF_LIFE_DIR) not in sys.path:
+    sys.path.insert(0, str(GAME_OF_LIFE_DIR))
+
+from grid_fingerprint import fingerprint_cells, fingerprint_str  # noqa: E402
+from gridv1 import Grid  # noqa: E402
+from gridv1_np import GridListNP, GridNP, Workspace, next_generation  # noqa: E402
+from gridv1_np_bits import GridNPBits  # noqa: E402
+
+ROWS, COLS = 32, 40  # 40 columns: GridNPBits' last word is only partly used
+GENERATIONS = 5
+
+
+def _initial_cells() -> np.ndarray:
+    return np.random.default_rng(42).integers(0, 2, size=(ROWS, COLS), dtype=np.uint8)
+
+
+def _numba_grid(cells):
+    return pytest.importorskip("gridv1_numba").GridNumba(ROWS, COLS, cells)
+
+
+def _cython_grid(cells):
+    # gridv1_cython imports the built `_gridc` extension (python build_gridc.py)
+    return pytest.importorskip("gridv1_cython").GridCython(ROWS, COLS, cells)
+
+
+# name -> factory taking a (ROWS, COLS) uint8 array the grid may not modify
+FACTORIES = {
+    "GridNP": lambda cells: GridNP(cells.copy()),
+    "GridListNP": lambda cells: GridListNP(ROWS, COLS, cells.tolist()),
+    "GridNPBits": lambda cells: GridNPBits(cells),
+    "GridNumba": _numba_grid,
+    "GridCython": _cython_grid,
+}
+
+
+@pytest.fixture(scope="module")
+def reference():
+    """Raw cells after each generation of the pure-Python reference grid."""
+    grid = Grid(ROWS, COLS, _initial_cells().tolist())
+    states = []
+    for _ in range(GENERATIONS):
+        grid = grid.evolve()
+        states.append((grid.raw_fingerprint_bytes(), grid.fingerprint()))
+    return states
+
+
+@pytest.mark.parametrize("name", FACTORIES)
+def test_grid_matches_reference(name, reference):
+    grid = FACTORIES[name](_initial_cells())
+    for generation, (raw, fp) in enumerate(reference, start=1):
+        grid = grid.evolve()
+        assert grid.raw_fingerprint_bytes() == raw, f"{name} diverges at generation {generation}"
+        assert grid.fingerprint() == fp
+
+
+def test_next_generation_with_workspace(reference):
+    """The allocation-free kernel, reusing one Workspace and two buffers."""
+    current = _initial_cells()
+    spare = np.empty_like(current)
+    work = Workspace(ROWS, COLS)
+    for raw, _ in reference:
+        next_generation(current, out=spare, work=work)
+        current, spare = spare, current
+        assert current.tobytes() == raw
+
+
+def test_fingerprint_is_shared(reference):
+    """Array, list-of-lists and flat '0'/'1' string inputs hash identically."""
+    raw, fp = reference[-1]
+    cells = np.frombuffer(raw, dtype=np.uint8).reshape(ROWS, COLS)
+    assert fingerprint_cells(cells) == fp
+    assert fingerprint_cells(cells.tolist()) == fp
+    assert fingerprint_str("".join(map(str, cells.ravel()))) == fp
@@ -0,0 +1,119 @@
+"""Levenshtein kernels from `src/levenshtein_distance/ld_kernels.py` vs a reference DP.
+
+Random strings cover the edges the bit-parallel kernels care about: empty
+strings, patterns of 63/64/65 characters (one machine word and either side
+of it) and strings longer than two words. The Numba kernels and the
+`_lev_myers` Cython extension are skipped when not installed or built.
+"""
+
+from __future__ import annotations
+
+import itertools
+import pathlib
+import random
+import sys
+
+import pytest
+
+pytest.importorskip("numpy")
+
+# Quick path tweak so `src/levenshtein_distance` is importable without
+# installing the package.
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+LEVENSHTEIN_DIR = PROJECT_ROOT / "src" / "levenshtein_distance"
+if str(LEVENSHTEIN_DIR) not in sys.path:
+    sys.path.insert(0, str(LEVENSHTEIN_DIR))
+
+import ld_kernels  # noqa: E402
+
+LENGTHS = [0, 1, 7, 63, 64, 65, 130, 200]
+
+
+def reference_distance(s1: str, s2: str) -> int:
+    """Textbook full-matrix Wagner-Fischer DP."""
+    d = [[0] * (len(s2) + 1) for _ in range(len(s1) + 1)]
+    for i in range(len(s1) + 1):
+        d[i][0] = i
+    for j in range(len(s2) + 1):
+        d[0][j] = j
+    for i in range(1, len(s1) + 1):
+        for j in range(1, len(s2) + 1):
+            d[i][j] = min(
+                d[i - 1][j] + 1,
+                d[i][j - 1] + 1,
+                d[i - 1][j - 1] + (s1[i - 1] != s2[j - 1]),
+            )
+    return d[-1][-1]
+
+
+def _pairs(alphabet: str, seed: int = 7):
+    """One random pair per (len1, len2) combination, plus its distance."""
+    rng = random.Random(seed)
+    pairs = []
+    for n1, n2 in itertools.combinations_with_replacement(LENGTHS, 2):
+        # Small alphabets keep the strings similar, so distances vary
+        s1 = "".join(rng.choices(alphabet, k=n1))
+        s2 = "".join(rng.choices(alphabet, k=n2))
+        pairs.append((s1, s2, reference_distance(s1, s2)))
+    return pairs
+
+
+LATIN1_PAIRS = _pairs("abcé")
+WIDE_PAIRS = _pairs("abλ✓")  # code points > 255: the kernels' hash-map paths
+
+
+def _ids(pairs):
+    return [f"{len(s1)}x{len(s2)}" for s1, s2, _ in pairs]
+
+
+@pytest.fixture(scope="module")
+def numba_kernels():
+    pytest.importorskip("numba")
+    return ld_kernels
+
+
+@pytest.mark.parametrize("s1, s2, expected", LATIN1_PAIRS, ids=_ids(LATIN1_PAIRS))
+def test_python_two_row(s1, s2, expected):
+    assert ld_kernels.levenshtein_python(s1, s2) == expected
+    assert ld_kernels.levenshtein_python(s2, s1) == expected
+
+
+@pytest.mark.parametrize("cutoff", [0, 3, 64])
+@pytest.mark.parametrize("s1, s2, expected", LATIN1_PAIRS, ids=_ids(LATIN1_PAIRS))
+def test_python_cutoff(s1, s2, expected, cutoff):
+    assert ld_kernels.levenshtein_python(s1, s2, cutoff=cutoff) == min(expected, cutoff + 1)
+
+
+@pytest.mark.parametrize("s1, s2, expected", LATIN1_PAIRS + WIDE_PAIRS)
+def test_myers64(numba_kernels, s1, s2, expected):
+    if min(len(s1), len(s2)) > 64:
+        with pytest.raises(ValueError):
+            numba_kernels.levenshtein_myers(s1, s2)
+    else:
+        assert numba_kernels.levenshtein_myers(s1, s2) == expected
+        assert numba_kernels.levenshtein_myers(s2, s1) == expected
+
+
+@pytest.mark.parametrize("threshold", [None, 0, 5, 70])
+@pytest.mark.parametrize("s1, s2, expected", LATIN1_PAIRS + WIDE_PAIRS)
+def test_banded(numba_kernels, s1, s2, expected, threshold):
+    want = expected if threshold is None else min(expected, threshold + 1)
+    assert numba_kernels.levenshtein_banded(s1, s2, threshold) == want
+
+
+@pytest.mark.parametrize("block", [1, 7, 64])
+@pytest.mark.parametrize("s1, s2, expected", LATIN1_PAIRS + WIDE_PAIRS)
+def test_blocked(numba_kernels, s1, s2, expected, block):
+    assert numba_kernels.levenshtein_blocked(s1, s2, block) == expected
+
+
+@pytest.mark.parametrize("s1, s2, expected", LATIN1_PAIRS + WIDE_PAIRS)
+def test_numba_two_row(numba_kernels, s1, s2, expected):
+    assert numba_kernels.levenshtein_numba(s1, s2) == expected
+
+
+@pytest.mark.parametrize("s1, s2, expected", LATIN1_PAIRS, ids=_ids(LATIN1_PAIRS))
+def test_simd_myers(s1, s2, expected):
+    lev_myers = pytest.importorskip("_lev_myers")  # python build_lev_myers.py
+    assert lev_myers.distance(s1, s2) == expected
+    assert lev_myers.distance(s2, s1) == expected
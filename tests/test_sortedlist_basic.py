@@ -41,8 +41,11 @@ class MojoSortedList:
     def __init__(self, iterable: list[int] | None = None) -> None:
         self._inner = mojo_sortedlist.SortedList()
         if iterable is not None:
-            for v in iterable:
-                self.add(v)
+            self.extend(iterable)
+
+    def extend(self, values) -> None:
+        # One crossing into Mojo, which sorts once rather than per value.
+        self._inner.extend(list(values))
 
     def add(self, value: int) -> None:
         self._inner.add(value)
@@ -56,9 +59,12 @@ class MojoSortedList:
     def __getitem__(self, index: int) -> int:
         return self._inner.__getitem__(index)
 
+    def to_list(self) -> list[int]:
+        return self._inner.to_list()
+
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        # One Mojo call for the whole list instead of one `self[i]` each.
+        return iter(self.to_list())
 
 
 pytestmark = pytest.mark.skipif(